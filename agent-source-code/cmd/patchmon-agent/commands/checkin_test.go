@@ -3,6 +3,7 @@ package commands
 import (
 	"encoding/json"
 	"testing"
+	"time"
 
 	"patchmon-agent/pkg/models"
 )
@@ -78,3 +79,61 @@ func TestShouldForceFullReport(t *testing.T) {
 		}
 	}
 }
+
+// TestComplianceUploadCurrent covers the record scheduled scans consult before
+// replacing an upload with an unchanged heartbeat: only the last uploaded
+// hash counts, it expires after complianceUploadMaxAge, and "" forces the
+// next upload.
+func TestComplianceUploadCurrent(t *testing.T) {
+	t.Cleanup(func() { setLastComplianceUpload("") })
+
+	setLastComplianceUpload("abc")
+	if !complianceUploadCurrent("abc") {
+		t.Error("just-uploaded hash is not current")
+	}
+	if complianceUploadCurrent("def") {
+		t.Error("a different hash is current")
+	}
+	if complianceUploadCurrent("") {
+		t.Error("an empty hash is current")
+	}
+
+	lastHashMu.Lock()
+	uploadedCompAt = time.Now().Add(-complianceUploadMaxAge)
+	lastHashMu.Unlock()
+	if complianceUploadCurrent("abc") {
+		t.Error("upload older than complianceUploadMaxAge is still current")
+	}
+
+	setLastComplianceUpload("abc")
+	setLastComplianceUpload("")
+	if complianceUploadCurrent("abc") {
+		t.Error("hash is still current after the record was reset")
+	}
+}
+
+// TestAllScansCompleted guards the heartbeat path: a failing scanner hashes
+// the same on every run, so any failed scan must force a full upload.
+func TestAllScansCompleted(t *testing.T) {
+	tests := []struct {
+		name     string
+		statuses []string
+		want     bool
+	}{
+		{"all completed", []string{"completed", "completed"}, true},
+		{"one failed", []string{"completed", "failed"}, false},
+		{"only failed", []string{"failed"}, false},
+		{"no scans", nil, false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			data := &models.ComplianceData{}
+			for _, status := range tt.statuses {
+				data.Scans = append(data.Scans, models.ComplianceScan{Status: status})
+			}
+			if got := allScansCompleted(data); got != tt.want {
+				t.Errorf("allScansCompleted(%v) = %v, want %v", tt.statuses, got, tt.want)
+			}
+		})
+	}
+}
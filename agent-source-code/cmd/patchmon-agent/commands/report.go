@@ -513,6 +513,13 @@ func sendComplianceData(httpClient *client.Client, integrationData *models.Integ
 	} else {
 		payload.ComplianceHash = ch
 		setLastComplianceHash(ch)
+		// Scheduled rescans of an unchanged host produce identical results;
+		// the server already holds them and only needs their scan date moved.
+		// The hash omits the error text, so a repeated failure hashes the
+		// same every run: failures are always uploaded in full.
+		if scanType == "scheduled" && allScansCompleted(complianceData) && complianceUploadCurrent(ch) && sendComplianceUnchanged(httpClient, complianceData, ch) {
+			return
+		}
 	}
 
 	totalRules := 0
@@ -534,12 +541,50 @@ func sendComplianceData(httpClient *client.Client, integrationData *models.Integ
 		return
 	}
 
+	setLastComplianceUpload(payload.ComplianceHash)
+
 	logger.WithFields(logrus.Fields{
 		"scans_received": response.ScansReceived,
 		"message":        response.Message,
 	}).Info("Compliance data sent successfully")
 }
 
+// allScansCompleted reports whether every scan in data completed; only such
+// results may be re-stamped on the server as a fresh scan
+func allScansCompleted(data *models.ComplianceData) bool {
+	for _, scan := range data.Scans {
+		if scan.Status != "completed" {
+			return false
+		}
+	}
+	return len(data.Scans) > 0
+}
+
+// sendComplianceUnchanged reports results with hash h as unchanged instead of
+// uploading them. It returns false when they must be uploaded in full.
+func sendComplianceUnchanged(httpClient *client.Client, complianceData *models.ComplianceData, h string) bool {
+	payload := &models.ComplianceUnchangedPayload{
+		ComplianceHash: h,
+		Scans:          make([]models.ComplianceProfileRef, 0, len(complianceData.Scans)),
+	}
+	for _, scan := range complianceData.Scans {
+		payload.Scans = append(payload.Scans, models.ComplianceProfileRef{
+			ProfileName: scan.ProfileName,
+			ProfileType: scan.ProfileType,
+		})
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+	defer cancel()
+
+	if _, err := httpClient.SendComplianceUnchanged(ctx, payload); err != nil {
+		logger.WithError(err).Debug("Server did not accept unchanged compliance results; uploading in full")
+		return false
+	}
+	logger.WithField("compliance_hash", h).Info("Compliance results unchanged since last upload; sent heartbeat instead of results")
+	return true
+}
+
 // forcedFullReportInterval is how many periodic ticks may pass before the
 // agent sends a full report regardless of what the hash compare said.
 //
@@ -727,7 +772,10 @@ func runCheckIn(ctx context.Context, forceFull bool) error {
 		// asks for compliance. The scheduled-scan path is intentionally
 		// reused — same compliance integration, same payload shape, just
 		// triggered by a ping response instead of a cron tick.
-		go runScheduledComplianceScan()
+		// The server's stored hash disagrees with ours, so the upload
+		// must not be skipped as unchanged.
+		setLastComplianceUpload("")
+		go runScheduledComplianceScan(context.Background())
 	}
 
 	return nil
@@ -841,6 +889,34 @@ func setLastComplianceHash(h string) {
 	cachedCompH = h
 }
 
+// complianceUploadMaxAge bounds how long scheduled scans may send a heartbeat
+// in place of unchanged results, so a full upload still lands weekly.
+const complianceUploadMaxAge = 7 * 24 * time.Hour
+
+// Hash and time of the last compliance upload the server accepted. Like the
+// hashes above this is process-lifetime only: a restart uploads once.
+var (
+	uploadedCompH  string
+	uploadedCompAt time.Time
+)
+
+// complianceUploadCurrent reports whether results with hash h were uploaded
+// recently enough that a scheduled scan may skip sending them again.
+func complianceUploadCurrent(h string) bool {
+	lastHashMu.Lock()
+	defer lastHashMu.Unlock()
+	return h != "" && h == uploadedCompH && time.Since(uploadedCompAt) < complianceUploadMaxAge
+}
+
+// setLastComplianceUpload records a successful upload; pass "" to force the
+// next upload regardless of its hash.
+func setLastComplianceUpload(h string) {
+	lastHashMu.Lock()
+	defer lastHashMu.Unlock()
+	uploadedCompH = h
+	uploadedCompAt = time.Now()
+}
+
 // Tiny helpers used by runCheckIn to lift Go zero-values into pointers when
 // building the PingMetrics. Keeping these inline lets the body of runCheckIn
 // stay readable.
@@ -864,7 +940,9 @@ func strPtrIfNonEmpty(s string) *string {
 	return &s
 }
 
-func runScheduledComplianceScan() {
+// runScheduledComplianceScan runs a compliance scan and submits the results.
+// Cancelling parent aborts the scan, e.g. when the scheduler is stopped.
+func runScheduledComplianceScan(parent context.Context) {
 	if !cfgManager.IsIntegrationEnabled("compliance") || cfgManager.IsComplianceOnDemandOnly() {
 		logger.Debug("Skipping scheduled compliance scan (not in enabled mode)")
 		return
@@ -901,13 +979,16 @@ func runScheduledComplianceScan() {
 	complianceInteg.SetScannerOptionsGetter(func() (bool, bool) {
 		return cfgManager.GetComplianceOpenscapEnabled(), cfgManager.GetComplianceDockerBenchEnabled()
 	})
+	// A scan that follows a recent one (an on-demand run, a shortened interval)
+	// reuses it when content and packages are unchanged
+	complianceInteg.SetResultReuseWindow(time.Duration(cfgManager.GetComplianceScanInterval()) * time.Minute / 2)
 
 	if !complianceInteg.IsAvailable() {
 		logger.Debug("Compliance scanning not available on this system, skipping scheduled scan")
 		return
 	}
 
-	ctx, cancel := context.WithTimeout(context.Background(), 25*time.Minute)
+	ctx, cancel := context.WithTimeout(parent, 25*time.Minute)
 	defer cancel()
 
 	complianceScanCancelMu.Lock()
@@ -920,6 +1001,10 @@ func runScheduledComplianceScan() {
 	}()
 
 	integrationData, err := complianceInteg.Collect(ctx)
+	if err == nil {
+		// Never upload what an interrupted scan left behind (see CollectWithOptions)
+		err = ctx.Err()
+	}
 	if err != nil {
 		if errors.Is(err, context.Canceled) {
 			logger.Info("Scheduled compliance scan was cancelled")
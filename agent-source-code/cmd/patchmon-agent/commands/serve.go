@@ -9,6 +9,7 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"math/rand/v2"
 	"net"
 	"net/http"
 	"os"
@@ -24,6 +25,7 @@ import (
 
 	"patchmon-agent/internal/client"
 	"patchmon-agent/internal/config"
+	"patchmon-agent/internal/hashing"
 	"patchmon-agent/internal/integrations"
 	"patchmon-agent/internal/integrations/compliance"
 	"patchmon-agent/internal/integrations/docker"
@@ -381,9 +383,18 @@ func runServiceLoop(stopCh <-chan struct{}) error {
 					}
 				}
 			case "report_now":
-				if err := sendReport(false); err != nil {
-					logger.WithError(err).Warn("report_now failed")
+				// Off the service loop: a full report can take minutes, and
+				// while it runs the WebSocket reader drops incoming messages
+				if !reportNowRunning.CompareAndSwap(false, true) {
+					logger.Info("report_now already in progress, ignoring")
+					break
 				}
+				go func() {
+					defer reportNowRunning.Store(false)
+					if err := sendReport(false); err != nil {
+						logger.WithError(err).Warn("report_now failed")
+					}
+				}()
 			case "update_agent":
 				if err := updateAgent(); err != nil {
 					logger.WithError(err).Warn("update_agent failed")
@@ -410,20 +421,36 @@ func runServiceLoop(stopCh <-chan struct{}) error {
 				})).Info("Running on-demand compliance scan...")
 				go func(msg wsMsg) {
 					complianceScanCancelMu.Lock()
-					if complianceScanSource == "scheduled" && complianceScanCancel != nil {
+					runningSource := complianceScanSource
+					if runningSource == "scheduled" && complianceScanCancel != nil {
 						complianceScanCancel()
 						logger.Info("Cancelled running scheduled scan to run on-demand scan")
 					}
 					complianceScanCancelMu.Unlock()
 
-					for i := 0; i < 10; i++ {
-						if complianceScanRunning.CompareAndSwap(false, true) {
-							break
+					// Only one oscap evaluation at a time: a second one thrashes
+					// CPU and memory for minutes. A repeated on-demand request is
+					// dropped (the running scan is already reporting progress);
+					// a cancelled scheduled scan gets a few seconds to exit.
+					acquired := false
+					if runningSource != "on-demand" {
+						for i := 0; i < 10; i++ {
+							if complianceScanRunning.CompareAndSwap(false, true) {
+								acquired = true
+								break
+							}
+							time.Sleep(500 * time.Millisecond)
 						}
-						time.Sleep(500 * time.Millisecond)
 					}
-					if !complianceScanRunning.Load() {
-						complianceScanRunning.Store(true)
+					if !acquired {
+						logger.WithField("running_source", runningSource).Info("Compliance scan already running, skipping on-demand scan")
+						// Tell the UI rather than leave it waiting on a scan that never starts
+						profileName := msg.profileID
+						if profileName == "" {
+							profileName = "default"
+						}
+						sendComplianceProgress("failed", profileName, "Another compliance scan is running", 0, "compliance scan already running")
+						return
 					}
 
 					complianceScanCancelMu.Lock()
@@ -508,8 +535,14 @@ func runServiceLoop(stopCh <-chan struct{}) error {
 					}
 				}()
 			case "remediate_rule":
+				// Remediation runs oscap too, so it shares the scan lock
+				if !complianceScanRunning.CompareAndSwap(false, true) {
+					logger.WithField("rule_id", logutil.Sanitize(m.ruleID)).Info("Compliance scan running, skipping rule remediation")
+					break
+				}
 				logger.WithField("rule_id", logutil.Sanitize(m.ruleID)).Info("Remediating single rule...")
 				go func(ruleID string) {
+					defer complianceScanRunning.Store(false)
 					if err := remediateSingleRule(ruleID); err != nil {
 						logger.WithError(err).WithField("rule_id", logutil.Sanitize(ruleID)).Warn("remediate_rule failed")
 					} else {
@@ -517,12 +550,17 @@ func runServiceLoop(stopCh <-chan struct{}) error {
 					}
 				}(m.ruleID)
 			case "docker_image_scan":
+				if !dockerImageScanRunning.CompareAndSwap(false, true) {
+					logger.Info("Docker image CVE scan already running, skipping")
+					break
+				}
 				logger.WithFields(logutil.SanitizeMap(map[string]interface{}{
 					"image_name":      m.imageName,
 					"container_name":  m.containerName,
 					"scan_all_images": m.scanAllImages,
 				})).Info("Running Docker image CVE scan...")
 				go func(msg wsMsg) {
+					defer dockerImageScanRunning.Store(false)
 					if err := runDockerImageScan(msg.imageName, msg.containerName, msg.scanAllImages); err != nil {
 						logger.WithError(err).Warn("docker_image_scan failed")
 					} else {
@@ -625,17 +663,17 @@ func upgradeSSGContent(targetVersion string) error {
 	logger.Info("Sending updated compliance status to backend...")
 	ctx := context.Background()
 
-	// Get new scanner details
-	openscapScanner := compliance.NewOpenSCAPScanner(logger)
+	// Get new scanner details (the upgrade invalidated the shared scanners, so these re-probe)
+	openscapScanner := compliance.SharedOpenSCAPScanner(logger)
 	scannerDetails := openscapScanner.GetScannerDetails()
 
 	// Check if Docker integration is enabled for Docker Bench and oscap-docker info
 	dockerIntegrationEnabled := cfgManager.IsIntegrationEnabled("docker")
 	if dockerIntegrationEnabled {
-		dockerBenchScanner := compliance.NewDockerBenchScanner(logger)
+		dockerBenchScanner := compliance.SharedDockerBenchScanner(logger)
 		scannerDetails.DockerBenchAvailable = dockerBenchScanner.IsAvailable()
 
-		oscapDockerScanner := compliance.NewOscapDockerScanner(logger)
+		oscapDockerScanner := compliance.SharedOscapDockerScanner(logger)
 		scannerDetails.OscapDockerAvailable = oscapDockerScanner.IsAvailable()
 	}
 
@@ -659,6 +697,10 @@ func upgradeSSGContent(targetVersion string) error {
 // runInstallScanner installs OpenSCAP and SSG content (apt/dnf install, update SSG) and reports status via HTTP
 // Sends granular install events so the frontend can display real-time progress.
 func runInstallScanner() error {
+	// Installing packages or syncing content changes what the shared scanners
+	// reported at construction; make the next scan re-probe
+	defer compliance.InvalidateScannerCache()
+
 	httpClient := client.New(cfgManager, logger)
 	ctx := context.Background()
 	enabled := cfgManager.IsIntegrationEnabled("compliance")
@@ -903,10 +945,11 @@ func reportIntegrationStatus(ctx context.Context) {
 
 	// Report compliance integration status if enabled
 	if cfgManager.IsIntegrationEnabled("compliance") {
-		// Create scanners to check actual availability
-		openscapScanner := compliance.NewOpenSCAPScanner(logger)
-		dockerBenchScanner := compliance.NewDockerBenchScanner(logger)
-		oscapDockerScanner := compliance.NewOscapDockerScanner(logger)
+		// Use the shared scanners to check actual availability; they re-probe
+		// after installs, upgrades and once their cache TTL expires
+		openscapScanner := compliance.SharedOpenSCAPScanner(logger)
+		dockerBenchScanner := compliance.SharedDockerBenchScanner(logger)
+		oscapDockerScanner := compliance.SharedOscapDockerScanner(logger)
 
 		// Get scanner details (includes OS info, profiles, etc.)
 		scannerDetails := openscapScanner.GetScannerDetails()
@@ -1245,6 +1288,28 @@ type ComplianceScanProgress struct {
 	Error       string  `json:"error,omitempty"`
 }
 
+// Outbound WebSocket frames for progress and Docker events. Typed structs
+// marshal without the key sorting and interface boxing a map needs, which
+// adds up for chatty Docker event streams.
+type complianceProgressMessage struct {
+	Type        string  `json:"type"`
+	Phase       string  `json:"phase"`
+	ProfileName string  `json:"profile_name"`
+	Message     string  `json:"message"`
+	Progress    float64 `json:"progress"`
+	Error       string  `json:"error"`
+	Timestamp   string  `json:"timestamp"`
+}
+
+type dockerStatusMessage struct {
+	Type        string                   `json:"type"`
+	Event       models.DockerStatusEvent `json:"event"`
+	ContainerID string                   `json:"container_id"`
+	Name        string                   `json:"name"`
+	Status      string                   `json:"status"`
+	Timestamp   time.Time                `json:"timestamp"`
+}
+
 // Global channel for compliance scan progress updates
 var complianceProgressChan = make(chan ComplianceScanProgress, 10)
 
@@ -1254,6 +1319,8 @@ var globalWsConnMu sync.RWMutex
 var globalWsWriteMu sync.Mutex
 
 var complianceScanRunning atomic.Bool
+var dockerImageScanRunning atomic.Bool
+var reportNowRunning atomic.Bool
 var complianceScanCancel context.CancelFunc
 var complianceScanCancelMu sync.Mutex
 var complianceScanSource string
@@ -1282,14 +1349,18 @@ var patchRunStopped sync.Map
 
 type complianceScheduler struct {
 	interval time.Duration
-	stopCh   chan struct{}
-	resetCh  chan time.Duration
+	// ctx is cancelled by Stop; it interrupts the waits and any scan in progress
+	ctx     context.Context
+	cancel  context.CancelFunc
+	resetCh chan time.Duration
 }
 
 func newComplianceScheduler(intervalMinutes int) *complianceScheduler {
+	ctx, cancel := context.WithCancel(context.Background())
 	return &complianceScheduler{
 		interval: time.Duration(intervalMinutes) * time.Minute,
-		stopCh:   make(chan struct{}),
+		ctx:      ctx,
+		cancel:   cancel,
 		resetCh:  make(chan time.Duration, 1),
 	}
 }
@@ -1299,7 +1370,7 @@ func (cs *complianceScheduler) Start() {
 }
 
 func (cs *complianceScheduler) Stop() {
-	close(cs.stopCh)
+	cs.cancel()
 }
 
 func (cs *complianceScheduler) Reset(intervalMinutes int) {
@@ -1315,18 +1386,18 @@ func (cs *complianceScheduler) loop() {
 
 	select {
 	case <-time.After(30 * time.Second):
-	case <-cs.stopCh:
+	case <-cs.ctx.Done():
 		return
 	}
 
-	runScheduledComplianceScan()
+	runScheduledComplianceScan(cs.ctx)
 
 	ticker := time.NewTicker(cs.interval)
 	defer ticker.Stop()
 
 	for {
 		select {
-		case <-cs.stopCh:
+		case <-cs.ctx.Done():
 			logger.Info("Compliance scheduler stopped")
 			return
 		case newInterval := <-cs.resetCh:
@@ -1335,7 +1406,13 @@ func (cs *complianceScheduler) loop() {
 			ticker = time.NewTicker(cs.interval)
 			logger.WithField("compliance_scan_interval_minutes", int(cs.interval.Minutes())).Info("Compliance scan interval updated")
 		case <-ticker.C:
-			runScheduledComplianceScan()
+			// select picks at random when a tick and Stop are both ready;
+			// never start a scan once shutdown has been requested
+			if cs.ctx.Err() != nil {
+				logger.Info("Compliance scheduler stopped")
+				return
+			}
+			runScheduledComplianceScan(cs.ctx)
 		}
 	}
 }
@@ -1465,6 +1542,18 @@ func dispatchWSMessage(out chan<- wsMsg, m wsMsg) {
 	}
 }
 
+// wsMaxBackoff caps the delay between failed WebSocket dials
+const wsMaxBackoff = 30 * time.Second
+
+// jitterBackoff spreads a reconnect delay uniformly over [d/2, 3d/2). Agents that
+// lost the server together would otherwise redial in lockstep when it returns.
+func jitterBackoff(d time.Duration) time.Duration {
+	if d <= 0 {
+		return 0
+	}
+	return d/2 + rand.N(d)
+}
+
 func wsLoop(out chan<- wsMsg, dockerEvents <-chan interface{}) {
 	backoff := time.Second
 	for {
@@ -1476,9 +1565,9 @@ func wsLoop(out chan<- wsMsg, dockerEvents <-chan interface{}) {
 		if err != nil {
 			logger.WithError(err).Warn("ws disconnected; retrying")
 		}
-		sleepFor := backoff
-		if !connected && backoff < 30*time.Second {
-			backoff *= 2
+		sleepFor := jitterBackoff(backoff)
+		if !connected && backoff < wsMaxBackoff {
+			backoff = min(backoff*2, wsMaxBackoff)
 		}
 		time.Sleep(sleepFor)
 	}
@@ -1577,13 +1666,13 @@ func connectOnce(out chan<- wsMsg, dockerEvents <-chan interface{}, backoff *tim
 					return // Channel closed
 				}
 				if dockerEvent, ok := event.(models.DockerStatusEvent); ok {
-					eventJSON, err := json.Marshal(map[string]interface{}{
-						"type":         "docker_status",
-						"event":        dockerEvent,
-						"container_id": dockerEvent.ContainerID,
-						"name":         dockerEvent.Name,
-						"status":       dockerEvent.Status,
-						"timestamp":    dockerEvent.Timestamp,
+					eventJSON, err := json.Marshal(dockerStatusMessage{
+						Type:        "docker_status",
+						Event:       dockerEvent,
+						ContainerID: dockerEvent.ContainerID,
+						Name:        dockerEvent.Name,
+						Status:      dockerEvent.Status,
+						Timestamp:   dockerEvent.Timestamp,
 					})
 					if err != nil {
 						logger.WithError(err).Warn("Failed to marshal Docker event")
@@ -1616,14 +1705,14 @@ func connectOnce(out chan<- wsMsg, dockerEvents <-chan interface{}, backoff *tim
 				if !ok {
 					return // Channel closed
 				}
-				progressJSON, err := json.Marshal(map[string]interface{}{
-					"type":         "compliance_scan_progress",
-					"phase":        progress.Phase,
-					"profile_name": progress.ProfileName,
-					"message":      progress.Message,
-					"progress":     progress.Progress,
-					"error":        progress.Error,
-					"timestamp":    time.Now().Format(time.RFC3339),
+				progressJSON, err := json.Marshal(complianceProgressMessage{
+					Type:        "compliance_scan_progress",
+					Phase:       progress.Phase,
+					ProfileName: progress.ProfileName,
+					Message:     progress.Message,
+					Progress:    progress.Progress,
+					Error:       progress.Error,
+					Timestamp:   time.Now().Format(time.RFC3339),
 				})
 				if err != nil {
 					logger.WithError(err).Warn("Failed to marshal compliance progress event")
@@ -2891,6 +2980,13 @@ func runComplianceScanWithOptions(ctx context.Context, options *models.Complianc
 		AgentVersion:   pkgversion.Version,
 		ScanType:       "on-demand",
 	}
+	// Stamp the canonical hash like scheduled uploads do, so a later scheduled
+	// scan that reproduces these results sends a heartbeat instead of them
+	if ch, err := hashing.ComplianceHash(complianceData); err != nil {
+		logger.WithError(err).Debug("compliance hash computation failed; uploading without hash")
+	} else {
+		payload.ComplianceHash = ch
+	}
 
 	// Debug: log what we're about to send
 	for i, scan := range payload.Scans {
@@ -2921,6 +3017,11 @@ func runComplianceScanWithOptions(ctx context.Context, options *models.Complianc
 		sendComplianceProgress("failed", profileName, "Failed to send results", 0, err.Error())
 		return fmt.Errorf("failed to send compliance data: %w", err)
 	}
+	// The server now holds these results, not the last scheduled ones
+	if payload.ComplianceHash != "" {
+		setLastComplianceHash(payload.ComplianceHash)
+	}
+	setLastComplianceUpload(payload.ComplianceHash)
 
 	// Send progress: completed with score
 	score := float64(0)
@@ -2960,8 +3061,8 @@ func runDockerImageScan(imageName, containerName string, scanAllImages bool) err
 		return fmt.Errorf("compliance integration is not enabled (required for oscap-docker)")
 	}
 
-	// Create oscap-docker scanner
-	oscapDockerScanner := compliance.NewOscapDockerScanner(logger)
+	// Reuse the shared oscap-docker scanner
+	oscapDockerScanner := compliance.SharedOscapDockerScanner(logger)
 	if !oscapDockerScanner.IsAvailable() {
 		sendComplianceProgress("failed", "Docker Image CVE Scan", "oscap-docker not available", 0, "oscap-docker is not installed or Docker is not running")
 		return fmt.Errorf("oscap-docker is not available")
@@ -3101,18 +3202,26 @@ type sshProxySession struct {
 var sshProxySessions = make(map[string]*sshProxySession)
 var sshProxySessionsMu sync.RWMutex
 
+// proxyMessage is the frame SSH and RDP proxy sessions send to the backend.
+// Data frames go out for every chunk of terminal or RDP traffic, so they are
+// marshalled from a struct rather than a freshly built map.
+type proxyMessage struct {
+	Type      string      `json:"type"`
+	SessionID string      `json:"session_id"`
+	Data      interface{} `json:"data,omitempty"`
+	Message   string      `json:"message,omitempty"`
+}
+
 // sendSSHProxyMessage sends a message to backend via WebSocket
 func sendSSHProxyMessage(conn *websocket.Conn, msgType string, sessionID string, data interface{}) {
-	msg := map[string]interface{}{
-		"type":       msgType,
-		"session_id": sessionID,
-	}
-	if data != nil {
-		msg["data"] = data
+	msg := proxyMessage{
+		Type:      msgType,
+		SessionID: sessionID,
+		Data:      data,
 	}
 	if msgType == "ssh_proxy_error" {
 		if errMsg, ok := data.(string); ok {
-			msg["message"] = errMsg
+			msg.Message = errMsg
 		}
 	}
 	msgJSON, err := json.Marshal(msg)
@@ -3471,16 +3580,14 @@ var rdpProxySessions = make(map[string]*rdpProxySession)
 var rdpProxySessionsMu sync.RWMutex
 
 func sendRDPProxyMessage(conn *websocket.Conn, msgType string, sessionID string, data interface{}) {
-	msg := map[string]interface{}{
-		"type":       msgType,
-		"session_id": sessionID,
-	}
-	if data != nil {
-		msg["data"] = data
+	msg := proxyMessage{
+		Type:      msgType,
+		SessionID: sessionID,
+		Data:      data,
 	}
 	if msgType == "rdp_proxy_error" {
 		if errMsg, ok := data.(string); ok {
-			msg["message"] = errMsg
+			msg.Message = errMsg
 		}
 	}
 	msgJSON, err := json.Marshal(msg)
@@ -433,3 +433,25 @@ func sendUntilStop(conn *websocket.Conn, stop <-chan struct{}, messageType int)
 		}
 	}
 }
+
+// TestJitterBackoff checks reconnect delays stay within [d/2, 3d/2) and are not
+// all identical, which would let a fleet of agents redial in lockstep.
+func TestJitterBackoff(t *testing.T) {
+	for _, d := range []time.Duration{time.Second, 8 * time.Second, wsMaxBackoff} {
+		seen := make(map[time.Duration]bool)
+		for i := 0; i < 100; i++ {
+			got := jitterBackoff(d)
+			if got < d/2 || got >= d+d/2 {
+				t.Fatalf("jitterBackoff(%v) = %v, want within [%v, %v)", d, got, d/2, d+d/2)
+			}
+			seen[got] = true
+		}
+		if len(seen) < 2 {
+			t.Errorf("jitterBackoff(%v) returned the same delay 100 times", d)
+		}
+	}
+
+	if got := jitterBackoff(0); got != 0 {
+		t.Errorf("jitterBackoff(0) = %v, want 0", got)
+	}
+}
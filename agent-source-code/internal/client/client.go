@@ -2,11 +2,18 @@
 package client
 
 import (
+	"bytes"
+	"compress/gzip"
 	"context"
 	"crypto/tls"
+	"encoding/json"
 	"fmt"
+	"net"
+	"net/http"
 	"os"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	"patchmon-agent/internal/config"
@@ -40,6 +47,54 @@ func IsSkipSSLVerifyEnvSet() bool {
 	return v == "true" || v == "1"
 }
 
+// Shared transports, one per TLS verification mode. Commands build a fresh
+// Client per request, so sharing the transport lets them reuse pooled
+// keep-alive connections to the server instead of paying a TCP and TLS
+// handshake each time.
+var (
+	sharedTransportOnce sync.Once
+	sharedTransport     *http.Transport
+	insecureTransport   *http.Transport
+)
+
+// newTransport returns a transport sized for the agent's traffic: a single
+// server, reached by the WebSocket plus occasional API calls.
+func newTransport(tlsConfig *tls.Config) *http.Transport {
+	dialer := &net.Dialer{
+		Timeout:   30 * time.Second,
+		KeepAlive: 30 * time.Second,
+	}
+	return &http.Transport{
+		Proxy:                 http.ProxyFromEnvironment,
+		DialContext:           dialer.DialContext,
+		ForceAttemptHTTP2:     true,
+		MaxIdleConns:          4,
+		MaxIdleConnsPerHost:   4,
+		IdleConnTimeout:       75 * time.Second,
+		TLSHandshakeTimeout:   10 * time.Second,
+		ExpectContinueTimeout: 1 * time.Second,
+		TLSClientConfig:       tlsConfig,
+	}
+}
+
+// transportFor returns the shared transport for the given TLS mode
+func transportFor(skipVerify bool) *http.Transport {
+	sharedTransportOnce.Do(func() {
+		sharedTransport = newTransport(nil)
+		insecureTransport = newTransport(&tls.Config{
+			InsecureSkipVerify: true,
+		})
+	})
+	if skipVerify {
+		return insecureTransport
+	}
+	return sharedTransport
+}
+
+// serverAcceptsGzip records whether the last ping advertised gzip upload
+// support. It is process-wide because commands build a new Client per request.
+var serverAcceptsGzip atomic.Bool
+
 // New creates a new HTTP client
 func New(configMgr *config.Manager, logger *logrus.Logger) *Client {
 	client := resty.New()
@@ -56,10 +111,8 @@ func New(configMgr *config.Manager, logger *logrus.Logger) *Client {
 	if skipVerify {
 		// Operator-gated insecure TLS for lab/air-gapped deployments.
 		logger.Warn("TLS certificate verification disabled - use only with trusted self-signed or internal CA certificates")
-		client.SetTLSClientConfig(&tls.Config{
-			InsecureSkipVerify: true,
-		})
 	}
+	client.SetTransport(transportFor(skipVerify))
 
 	return &Client{
 		client:      client,
@@ -108,6 +161,7 @@ func (c *Client) Ping(ctx context.Context, req *models.PingRequest) (*models.Pin
 	if !ok {
 		return nil, fmt.Errorf("invalid response format")
 	}
+	serverAcceptsGzip.Store(result.GzipUploads)
 
 	return result, nil
 }
@@ -297,6 +351,62 @@ func (c *Client) SendComplianceData(ctx context.Context, payload *models.Complia
 		"scans":  len(payload.Scans),
 	}).Debug("Sending compliance data to server")
 
+	// Encode the scan results once up front. Handing resty the struct would
+	// re-marshal it on every retry attempt (resty still copies the bytes into
+	// each attempt's request); a streamed body could not be replayed at all.
+	var body bytes.Buffer
+	if err := json.NewEncoder(&body).Encode(payload); err != nil {
+		return nil, fmt.Errorf("failed to encode compliance data: %w", err)
+	}
+
+	req := c.client.R().
+		SetContext(ctx).
+		SetHeader("Content-Type", "application/json").
+		SetHeader("X-API-ID", c.credentials.APIID).
+		SetHeader("X-API-KEY", c.credentials.APIKey).
+		SetResult(&models.ComplianceResponse{})
+
+	// Scan results repeat the same rule prefixes and statuses hundreds of
+	// times and compress several-fold; only servers that say so accept gzip
+	if serverAcceptsGzip.Load() {
+		compressed, err := gzipBytes(body.Bytes())
+		if err != nil {
+			return nil, fmt.Errorf("failed to compress compliance data: %w", err)
+		}
+		c.logger.WithFields(logrus.Fields{
+			"json_bytes": body.Len(),
+			"gzip_bytes": len(compressed),
+		}).Debug("Compressed compliance data")
+		req.SetHeader("Content-Encoding", "gzip").SetBody(compressed)
+	} else {
+		req.SetBody(body.Bytes())
+	}
+
+	resp, err := req.Post(url)
+
+	if err != nil {
+		return nil, fmt.Errorf("compliance data request failed: %w", err)
+	}
+
+	if resp.StatusCode() != 200 {
+		c.logger.WithField("response", resp.String()).Debug("Full error response from compliance data request")
+		return nil, fmt.Errorf("compliance data request failed with status %d: %s", resp.StatusCode(), truncateResponse(resp.String(), 200))
+	}
+
+	result, ok := resp.Result().(*models.ComplianceResponse)
+	if !ok {
+		return nil, fmt.Errorf("invalid response format")
+	}
+
+	return result, nil
+}
+
+// SendComplianceUnchanged tells the server a scan reproduced the results it
+// already holds. Any error, including a server that lacks the endpoint or no
+// longer holds those results, means the results must be uploaded in full.
+func (c *Client) SendComplianceUnchanged(ctx context.Context, payload *models.ComplianceUnchangedPayload) (*models.ComplianceResponse, error) {
+	url := fmt.Sprintf("%s/api/%s/compliance/scans/unchanged", c.config.PatchmonServer, c.config.APIVersion)
+
 	resp, err := c.client.R().
 		SetContext(ctx).
 		SetHeader("Content-Type", "application/json").
@@ -307,12 +417,11 @@ func (c *Client) SendComplianceData(ctx context.Context, payload *models.Complia
 		Post(url)
 
 	if err != nil {
-		return nil, fmt.Errorf("compliance data request failed: %w", err)
+		return nil, fmt.Errorf("compliance unchanged request failed: %w", err)
 	}
 
 	if resp.StatusCode() != 200 {
-		c.logger.WithField("response", resp.String()).Debug("Full error response from compliance data request")
-		return nil, fmt.Errorf("compliance data request failed with status %d: %s", resp.StatusCode(), truncateResponse(resp.String(), 200))
+		return nil, fmt.Errorf("compliance unchanged request failed with status %d: %s", resp.StatusCode(), truncateResponse(resp.String(), 200))
 	}
 
 	result, ok := resp.Result().(*models.ComplianceResponse)
@@ -323,6 +432,19 @@ func (c *Client) SendComplianceData(ctx context.Context, payload *models.Complia
 	return result, nil
 }
 
+// gzipBytes returns data gzip-compressed at the default level
+func gzipBytes(data []byte) ([]byte, error) {
+	var buf bytes.Buffer
+	zw := gzip.NewWriter(&buf)
+	if _, err := zw.Write(data); err != nil {
+		return nil, err
+	}
+	if err := zw.Close(); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
 // SSGVersionResponse represents the server's response to GET /compliance/ssg-version.
 type SSGVersionResponse struct {
 	Version string   `json:"version"`
@@ -0,0 +1,88 @@
+package client
+
+import (
+	"compress/gzip"
+	"context"
+	"encoding/json"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+
+	"patchmon-agent/pkg/models"
+)
+
+// TestSendComplianceDataGzip checks that compliance uploads are compressed
+// only after the server advertised gzipUploads on a ping, and that the
+// compressed body decodes to the same payload.
+func TestSendComplianceDataGzip(t *testing.T) {
+	tests := []struct {
+		name         string
+		pingResponse string
+		wantEncoding string
+	}{
+		{
+			name:         "gzip_capable_server",
+			pingResponse: `{"message":"pong","hashGate":true,"gzipUploads":true}`,
+			wantEncoding: "gzip",
+		},
+		{
+			name:         "legacy_server_gets_plain_json",
+			pingResponse: `{"message":"pong","hashGate":true}`,
+			wantEncoding: "",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var gotEncoding string
+			var gotPayload models.CompliancePayload
+
+			srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+				w.Header().Set("Content-Type", "application/json")
+				if r.URL.Path == "/api/v1/hosts/ping" {
+					_, _ = w.Write([]byte(tt.pingResponse))
+					return
+				}
+
+				gotEncoding = r.Header.Get("Content-Encoding")
+				var body io.Reader = r.Body
+				if gotEncoding == "gzip" {
+					zr, err := gzip.NewReader(r.Body)
+					if err != nil {
+						t.Errorf("invalid gzip body: %v", err)
+						return
+					}
+					body = zr
+				}
+				if err := json.NewDecoder(body).Decode(&gotPayload); err != nil {
+					t.Errorf("failed to decode compliance body: %v", err)
+				}
+				_, _ = w.Write([]byte(`{"message":"ok","scans_received":1}`))
+			}))
+			defer srv.Close()
+
+			c := newTestClient(t, srv.URL)
+			if _, err := c.Ping(context.Background(), nil); err != nil {
+				t.Fatalf("Ping() returned error: %v", err)
+			}
+
+			payload := &models.CompliancePayload{
+				ComplianceData: models.ComplianceData{
+					Scans: []models.ComplianceScan{{ProfileName: "level1_server", ProfileType: "openscap"}},
+				},
+				Hostname: "web-01",
+			}
+			if _, err := c.SendComplianceData(context.Background(), payload); err != nil {
+				t.Fatalf("SendComplianceData() returned error: %v", err)
+			}
+
+			if gotEncoding != tt.wantEncoding {
+				t.Fatalf("Content-Encoding = %q, want %q", gotEncoding, tt.wantEncoding)
+			}
+			if gotPayload.Hostname != "web-01" || len(gotPayload.Scans) != 1 || gotPayload.Scans[0].ProfileName != "level1_server" {
+				t.Fatalf("server decoded %+v, want the sent payload", gotPayload)
+			}
+		})
+	}
+}
@@ -2,6 +2,7 @@
 package config
 
 import (
+	"bytes"
 	"errors"
 	"fmt"
 	"io/fs"
@@ -284,16 +285,20 @@ func (m *Manager) ensureComplianceNestedLocked() {
 func (m *Manager) LoadCredentials() error {
 	m.mu.Lock()
 	defer m.mu.Unlock()
-	if _, err := os.Stat(m.config.CredentialsFile); errors.Is(err, fs.ErrNotExist) {
+	// Read once and parse from memory: credentials are reloaded on every
+	// check-in, and the read doubles as the existence check
+	data, err := os.ReadFile(m.config.CredentialsFile)
+	if errors.Is(err, fs.ErrNotExist) {
 		return fmt.Errorf("credentials file not found at %s", m.config.CredentialsFile)
 	}
+	if err != nil {
+		return fmt.Errorf("error reading credentials file: %w", err)
+	}
 
-	viper.New()
 	credViper := viper.New()
-	credViper.SetConfigFile(m.config.CredentialsFile)
 	credViper.SetConfigType("yaml")
 
-	if err := credViper.ReadInConfig(); err != nil {
+	if err := credViper.ReadConfig(bytes.NewReader(data)); err != nil {
 		return fmt.Errorf("error reading credentials file: %w", err)
 	}
 
@@ -4,6 +4,7 @@ package compliance
 import (
 	"context"
 	"fmt"
+	"sync"
 	"time"
 
 	"patchmon-agent/internal/utils"
@@ -14,6 +15,93 @@ import (
 
 const integrationName = "compliance"
 
+// scannerCacheTTL bounds how long shared scanners are reused before the
+// environment (oscap binary, SCAP content, Docker daemon) is probed again.
+const scannerCacheTTL = time.Hour
+
+// scannerCache holds the scanners shared by every Integration in the process.
+// Constructing a scanner runs `oscap --version`, `docker info`, reads
+// /etc/os-release and probes the content directory, so scheduled and
+// on-demand scans and status reports reuse one set instead of re-probing on
+// every call. Shared scanners are treated as read-only; tooling installs and
+// content upgrades work on private instances and then invalidate the cache.
+var scannerCache struct {
+	sync.Mutex
+	openscap    *OpenSCAPScanner
+	dockerBench *DockerBenchScanner
+	oscapDocker *OscapDockerScanner // created on first use; only image scans need it
+	createdAt   time.Time
+}
+
+// refreshScannerCacheLocked (re)creates the shared scanners on first use or once
+// they are older than scannerCacheTTL. The caller must hold scannerCache.
+func refreshScannerCacheLocked(logger *logrus.Logger) {
+	if scannerCache.openscap != nil && time.Since(scannerCache.createdAt) <= scannerCacheTTL {
+		return
+	}
+
+	// Probing oscap and the Docker daemon are independent and both spawn
+	// processes, so construct the scanners concurrently
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		scannerCache.dockerBench = NewDockerBenchScanner(logger)
+	}()
+	scannerCache.openscap = NewOpenSCAPScanner(logger)
+	wg.Wait()
+	scannerCache.oscapDocker = nil
+	scannerCache.createdAt = time.Now()
+}
+
+// sharedScanners returns the process-wide OpenSCAP and Docker Bench scanners
+func sharedScanners(logger *logrus.Logger) (*OpenSCAPScanner, *DockerBenchScanner) {
+	scannerCache.Lock()
+	defer scannerCache.Unlock()
+
+	refreshScannerCacheLocked(logger)
+	return scannerCache.openscap, scannerCache.dockerBench
+}
+
+// SharedOpenSCAPScanner returns the process-wide OpenSCAP scanner.
+// It must not be used to install or upgrade; use NewOpenSCAPScanner for that.
+func SharedOpenSCAPScanner(logger *logrus.Logger) *OpenSCAPScanner {
+	openscap, _ := sharedScanners(logger)
+	return openscap
+}
+
+// SharedDockerBenchScanner returns the process-wide Docker Bench scanner.
+// It must not be used to install; use NewDockerBenchScanner for that.
+func SharedDockerBenchScanner(logger *logrus.Logger) *DockerBenchScanner {
+	_, dockerBench := sharedScanners(logger)
+	return dockerBench
+}
+
+// SharedOscapDockerScanner returns the process-wide oscap-docker scanner.
+// It must not be used to install; use NewOscapDockerScanner for that.
+func SharedOscapDockerScanner(logger *logrus.Logger) *OscapDockerScanner {
+	scannerCache.Lock()
+	defer scannerCache.Unlock()
+
+	refreshScannerCacheLocked(logger)
+	if scannerCache.oscapDocker == nil {
+		scannerCache.oscapDocker = NewOscapDockerScanner(logger)
+	}
+	return scannerCache.oscapDocker
+}
+
+// InvalidateScannerCache discards the shared scanners so the next Integration
+// re-probes the environment. Call after installing scanner packages or
+// upgrading SCAP content.
+func InvalidateScannerCache() {
+	scannerCache.Lock()
+	defer scannerCache.Unlock()
+
+	scannerCache.openscap = nil
+	scannerCache.dockerBench = nil
+	scannerCache.oscapDocker = nil
+}
+
 // ScannerOptionsGetter returns openscap and docker bench enabled flags for scheduled scans.
 // When set, used when CollectWithOptions is called with options=nil.
 type ScannerOptionsGetter func() (openscapEnabled, dockerBenchEnabled bool)
@@ -21,27 +109,53 @@ type ScannerOptionsGetter func() (openscapEnabled, dockerBenchEnabled bool)
 // Integration implements the Integration interface for compliance scanning
 type Integration struct {
 	logger                   *logrus.Logger
-	openscap                 *OpenSCAPScanner
+	scannersOnce             sync.Once
+	openscap                 *OpenSCAPScanner // set by loadScanners
 	dockerBench              *DockerBenchScanner
 	dockerIntegrationEnabled bool
 	scannerOptionsGetter     ScannerOptionsGetter
+	resultReuseWindow        time.Duration
 }
 
-// New creates a new Compliance integration
+// markCompleted stamps a finished scan with its start and completion times.
+// Both are recorded in UTC, like CollectedAt, so every scan timestamp in a
+// payload serializes the same way.
+func markCompleted(scan *models.ComplianceScan, startTime time.Time) {
+	completedAt := utils.GetCurrentTimeUTC()
+	scan.StartedAt = startTime.UTC()
+	scan.CompletedAt = &completedAt
+	scan.Status = "completed"
+}
+
+// New creates a new Compliance integration backed by the shared scanners.
+// The scanners are resolved on first use, so callers that only upgrade SSG
+// content never probe oscap or Docker.
 func New(logger *logrus.Logger) *Integration {
 	return &Integration{
 		logger:                   logger,
-		openscap:                 NewOpenSCAPScanner(logger),
-		dockerBench:              NewDockerBenchScanner(logger),
 		dockerIntegrationEnabled: false,
 	}
 }
 
+// loadScanners resolves the shared scanners once per integration
+func (c *Integration) loadScanners() {
+	c.scannersOnce.Do(func() {
+		c.openscap, c.dockerBench = sharedScanners(c.logger)
+	})
+}
+
 // SetScannerOptionsGetter sets the getter for scanner toggles when options is nil (scheduled scans).
 func (c *Integration) SetScannerOptionsGetter(getter ScannerOptionsGetter) {
 	c.scannerOptionsGetter = getter
 }
 
+// SetResultReuseWindow lets scheduled scans reuse an OpenSCAP result younger
+// than window when the SCAP content, profile and installed packages are
+// unchanged. Zero (the default) always runs a full scan.
+func (c *Integration) SetResultReuseWindow(window time.Duration) {
+	c.resultReuseWindow = window
+}
+
 // SetDockerIntegrationEnabled sets whether Docker integration is enabled
 // Docker Bench scans will only run if this is true AND Docker is available
 func (c *Integration) SetDockerIntegrationEnabled(enabled bool) {
@@ -65,6 +179,7 @@ func (c *Integration) SupportsRealtime() bool {
 
 // IsAvailable checks if compliance scanning is available on this system
 func (c *Integration) IsAvailable() bool {
+	c.loadScanners()
 	// Available if either OpenSCAP or Docker Bench is available
 	oscapAvail := c.openscap.IsAvailable()
 	dockerBenchAvail := c.dockerBench.IsAvailable()
@@ -87,6 +202,7 @@ func (c *Integration) Collect(ctx context.Context) (*models.IntegrationData, err
 // CollectWithOptions gathers compliance scan data with scan options (remediation, etc.)
 func (c *Integration) CollectWithOptions(ctx context.Context, options *models.ComplianceScanOptions) (*models.IntegrationData, error) {
 	startTime := time.Now()
+	c.loadScanners()
 
 	c.logger.Info("Starting compliance scan collection...")
 
@@ -128,79 +244,44 @@ func (c *Integration) CollectWithOptions(ctx context.Context, options *models.Co
 	isDockerBenchOnly := profileID == "docker-bench"
 
 	// Run OpenSCAP scan if available, enabled via per-host toggle, and not a Docker Bench only request
-	if c.openscap.IsAvailable() && openscapScanEnabled && !isDockerBenchOnly {
-		var scan *models.ComplianceScan
-		var err error
-
-		if options != nil && options.EnableRemediation {
-			c.logger.Info("Running OpenSCAP CIS benchmark scan with remediation enabled...")
-			scan, err = c.openscap.RunScanWithOptions(ctx, options)
-		} else {
-			c.logger.Info("Running OpenSCAP CIS benchmark scan...")
-			scanProfileID := "level1_server"
-			if profileID != "" {
-				scanProfileID = profileID
-			}
-			scan, err = c.openscap.RunScan(ctx, scanProfileID)
-		}
-
-		if err != nil {
-			c.logger.WithError(err).Warn("OpenSCAP scan failed")
-			// Add failed scan result
-			complianceData.Scans = append(complianceData.Scans, models.ComplianceScan{
-				ProfileName: "level1_server",
-				ProfileType: "openscap",
-				Status:      "failed",
-				StartedAt:   startTime,
-				Error:       err.Error(),
-			})
-		} else {
-			complianceData.Scans = append(complianceData.Scans, *scan)
-			logFields := logrus.Fields{
-				"profile": scan.ProfileName,
-				"score":   fmt.Sprintf("%.1f%%", scan.Score),
-				"passed":  scan.Passed,
-				"failed":  scan.Failed,
-			}
-			if scan.RemediationApplied {
-				logFields["remediation_count"] = scan.RemediationCount
-			}
-			c.logger.WithFields(logFields).Info("OpenSCAP scan completed")
-		}
-	}
+	runOpenSCAP := c.openscap.IsAvailable() && openscapScanEnabled && !isDockerBenchOnly
 
 	// Run Docker Bench scan if Docker integration is enabled AND Docker is available AND per-host toggle allows it
 	// Always run if docker-bench profile is specifically selected, or if running all profiles
 	runDockerBench := dockerBenchEffectivelyAvailable && dockerBenchScanEnabled && (isDockerBenchOnly || profileID == "" || profileID == "all")
+
+	// The two scanners drive separate tools, so run them side by side;
+	// results are still appended in a fixed order (OpenSCAP first).
+	var openscapScan, dockerBenchScan models.ComplianceScan
+	var wg sync.WaitGroup
+	if runOpenSCAP {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			openscapScan = c.runOpenSCAPScan(ctx, options, profileID, startTime)
+		}()
+	}
 	if runDockerBench {
-		c.logger.Info("Running Docker Bench for Security scan...")
-		scan, err := c.dockerBench.RunScan(ctx)
-		if err != nil {
-			c.logger.WithError(err).Warn("Docker Bench scan failed")
-			// Add failed scan result with truncated error message
-			errMsg := err.Error()
-			if len(errMsg) > 500 {
-				errMsg = errMsg[:500] + "... (truncated)"
-			}
-			now := time.Now()
-			complianceData.Scans = append(complianceData.Scans, models.ComplianceScan{
-				ProfileName: "Docker Bench for Security",
-				ProfileType: "docker-bench",
-				Status:      "failed",
-				StartedAt:   startTime,
-				CompletedAt: &now,
-				Error:       errMsg,
-			})
-		} else {
-			complianceData.Scans = append(complianceData.Scans, *scan)
-			c.logger.WithFields(logrus.Fields{
-				"profile":  scan.ProfileName,
-				"score":    fmt.Sprintf("%.1f%%", scan.Score),
-				"passed":   scan.Passed,
-				"failed":   scan.Failed,
-				"warnings": scan.Warnings,
-			}).Info("Docker Bench scan completed")
-		}
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			dockerBenchScan = c.runDockerBenchScan(ctx, startTime)
+		}()
+	}
+	wg.Wait()
+
+	// A cancelled or timed-out run leaves only "context canceled" failures;
+	// submitting them would replace the host's last good results on the server
+	if err := ctx.Err(); err != nil {
+		c.logger.WithError(err).Info("Compliance scan collection interrupted; discarding results")
+		return nil, err
+	}
+
+	if runOpenSCAP {
+		complianceData.Scans = append(complianceData.Scans, openscapScan)
+	}
+	if runDockerBench {
+		complianceData.Scans = append(complianceData.Scans, dockerBenchScan)
 	}
 
 	executionTime := time.Since(startTime).Seconds()
@@ -214,18 +295,94 @@ func (c *Integration) CollectWithOptions(ctx context.Context, options *models.Co
 	}, nil
 }
 
+// runOpenSCAPScan runs the OpenSCAP scan, returning a failed scan result on error
+func (c *Integration) runOpenSCAPScan(ctx context.Context, options *models.ComplianceScanOptions, profileID string, startTime time.Time) models.ComplianceScan {
+	var scan *models.ComplianceScan
+	var err error
+
+	if options != nil && options.EnableRemediation {
+		c.logger.Info("Running OpenSCAP CIS benchmark scan with remediation enabled...")
+		scan, err = c.openscap.RunScanWithOptions(ctx, options)
+	} else {
+		c.logger.Info("Running OpenSCAP CIS benchmark scan...")
+		scanProfileID := "level1_server"
+		if profileID != "" {
+			scanProfileID = profileID
+		}
+		if options == nil {
+			scan, err = c.openscap.RunScanReusing(ctx, scanProfileID, c.resultReuseWindow)
+		} else {
+			scan, err = c.openscap.RunScan(ctx, scanProfileID)
+		}
+	}
+
+	if err != nil {
+		c.logger.WithError(err).Warn("OpenSCAP scan failed")
+		now := utils.GetCurrentTimeUTC()
+		return models.ComplianceScan{
+			ProfileName: "level1_server",
+			ProfileType: "openscap",
+			Status:      "failed",
+			StartedAt:   startTime.UTC(),
+			CompletedAt: &now,
+			Error:       err.Error(),
+		}
+	}
+
+	logFields := logrus.Fields{
+		"profile": scan.ProfileName,
+		"score":   fmt.Sprintf("%.1f%%", scan.Score),
+		"passed":  scan.Passed,
+		"failed":  scan.Failed,
+	}
+	if scan.RemediationApplied {
+		logFields["remediation_count"] = scan.RemediationCount
+	}
+	c.logger.WithFields(logFields).Info("OpenSCAP scan completed")
+	return *scan
+}
+
+// runDockerBenchScan runs the Docker Bench scan, returning a failed scan result on error
+func (c *Integration) runDockerBenchScan(ctx context.Context, startTime time.Time) models.ComplianceScan {
+	c.logger.Info("Running Docker Bench for Security scan...")
+	scan, err := c.dockerBench.RunScan(ctx)
+	if err != nil {
+		c.logger.WithError(err).Warn("Docker Bench scan failed")
+		// Failed scan result with truncated error message
+		errMsg := err.Error()
+		if len(errMsg) > 500 {
+			errMsg = errMsg[:500] + "... (truncated)"
+		}
+		now := utils.GetCurrentTimeUTC()
+		return models.ComplianceScan{
+			ProfileName: "Docker Bench for Security",
+			ProfileType: "docker-bench",
+			Status:      "failed",
+			StartedAt:   startTime.UTC(),
+			CompletedAt: &now,
+			Error:       errMsg,
+		}
+	}
+
+	c.logger.WithFields(logrus.Fields{
+		"profile":  scan.ProfileName,
+		"score":    fmt.Sprintf("%.1f%%", scan.Score),
+		"passed":   scan.Passed,
+		"failed":   scan.Failed,
+		"warnings": scan.Warnings,
+	}).Info("Docker Bench scan completed")
+	return *scan
+}
+
 // UpgradeSSGContent upgrades the SCAP Security Guide content packages (legacy GitHub fallback).
 func (c *Integration) UpgradeSSGContent() error {
-	if c.openscap == nil {
-		return fmt.Errorf("OpenSCAP scanner not initialized")
-	}
-	return c.openscap.UpgradeSSGContent()
+	// Upgrade through a private scanner: the shared one may be in use by a running scan
+	defer InvalidateScannerCache()
+	return NewOpenSCAPScanner(c.logger).UpgradeSSGContent()
 }
 
 // UpgradeSSGContentFromServer downloads SSG content from the PatchMon server.
 func (c *Integration) UpgradeSSGContentFromServer(downloader SSGContentDownloader, targetVersion string) error {
-	if c.openscap == nil {
-		return fmt.Errorf("OpenSCAP scanner not initialized")
-	}
-	return c.openscap.UpgradeSSGContentFromServer(downloader, targetVersion)
+	defer InvalidateScannerCache()
+	return NewOpenSCAPScanner(c.logger).UpgradeSSGContentFromServer(downloader, targetVersion)
 }
@@ -0,0 +1,56 @@
+package compliance
+
+import (
+	"context"
+	"errors"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"patchmon-agent/pkg/models"
+)
+
+// TestCollectDiscardsCancelledScan stops a scheduled scan while oscap is
+// running, as stopping the compliance scheduler does. The interrupted run must
+// come back as an error rather than as "failed" scans a caller would upload
+// over the host's last good results.
+func TestCollectDiscardsCancelledScan(t *testing.T) {
+	dir := t.TempDir()
+	// Stand-in oscap: lists one profile, and otherwise runs until killed
+	fakeOscap := "#!/bin/sh\nif [ \"$1\" = info ]; then echo 'xccdf_org.ssgproject.content_profile_cis_level1_server:CIS'; exit 0; fi\nexec sleep 30\n"
+	if err := os.WriteFile(filepath.Join(dir, oscapBinary), []byte(fakeOscap), 0o700); err != nil {
+		t.Fatal(err)
+	}
+	t.Setenv("PATH", dir+string(os.PathListSeparator)+os.Getenv("PATH"))
+
+	contentFile := filepath.Join(dir, "ssg-ubuntu2204-ds.xml")
+	if err := os.WriteFile(contentFile, []byte("<data-stream-collection/>"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	origDir := scapContentDir
+	scapContentDir = dir
+	t.Cleanup(func() { scapContentDir = origDir })
+
+	s := newTestOpenSCAPScanner()
+	s.available = true
+	s.osInfo = models.ComplianceOSInfo{Family: "debian", Name: "ubuntu", Version: "22.04"}
+	c := &Integration{logger: s.logger, openscap: s, dockerBench: &DockerBenchScanner{logger: s.logger}}
+	c.scannersOnce.Do(func() {})
+
+	ctx, cancel := context.WithCancel(context.Background())
+	time.AfterFunc(200*time.Millisecond, cancel)
+	defer cancel()
+
+	start := time.Now()
+	data, err := c.Collect(ctx)
+	if !errors.Is(err, context.Canceled) {
+		t.Fatalf("Collect() = %+v, %v; want context.Canceled", data, err)
+	}
+	if data != nil {
+		t.Errorf("Collect() returned data %+v for a cancelled scan", data)
+	}
+	if elapsed := time.Since(start); elapsed > 10*time.Second {
+		t.Errorf("Collect() took %v to notice the cancellation", elapsed)
+	}
+}
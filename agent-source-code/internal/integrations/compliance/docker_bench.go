@@ -24,6 +24,67 @@ const (
 	dockerBenchImage = "jauderho/docker-bench-security:latest"
 )
 
+// Docker Bench output patterns, compiled once at package init rather than on every parse.
+//
+//	[PASS] 1.1.1 - Ensure a separate partition for containers has been created
+//	[WARN] 1.1.2 - Ensure only trusted users are allowed to control Docker daemon
+//	[INFO] 1.1.3 - Ensure auditing is configured for the Docker daemon
+//	[NOTE] 4.5 - Ensure Content trust for Docker is Enabled
+var (
+	// Check result lines; a single alternation classifies the line in one match.
+	// Groups: 1 = status tag, 2 = rule ID, 3 = title
+	dockerBenchCheckPattern = regexp.MustCompile(`\[(PASS|WARN|INFO|NOTE)\]\s+(\d+\.\d+(?:\.\d+)?)\s+-\s+(.+)`)
+)
+
+// dockerBenchRemediationPrefix starts the bullet text of remediation lines (printed with -p flag)
+const dockerBenchRemediationPrefix = "Remediation:"
+
+// dockerBenchBullet returns the text of an indented bullet line such as
+// "     * Running as root: web" (detail/finding and remediation lines)
+func dockerBenchBullet(line string) (string, bool) {
+	trimmed := strings.TrimLeft(line, " \t")
+	if len(trimmed) == len(line) || len(trimmed) < 3 || trimmed[0] != '*' || (trimmed[1] != ' ' && trimmed[1] != '\t') {
+		return "", false
+	}
+	return strings.TrimLeft(trimmed[2:], " \t"), true
+}
+
+// isDockerBenchContinuation reports whether line is deeply indented text
+// without a bullet, continuing the previous remediation
+func isDockerBenchContinuation(line string) bool {
+	return len(line) > 6 && strings.TrimLeft(line[:6], " \t") == ""
+}
+
+// Docker Bench sections, indexed by the leading digit of the rule ID
+// (index 0 is unused: there is no section 0)
+var dockerBenchSections = [...]string{
+	1: "Host Configuration",
+	2: "Docker Daemon Configuration",
+	3: "Docker Daemon Configuration Files",
+	4: "Container Images and Build File",
+	5: "Container Runtime",
+	6: "Docker Security Operations",
+	7: "Docker Swarm Configuration",
+}
+
+// Bytes of Docker Bench output kept for diagnostic logging
+const dockerBenchPreviewLen = 500
+
+// Common Docker socket locations, checked in order when DOCKER_HOST is not a unix socket
+var dockerSocketPaths = []string{
+	"/var/run/docker.sock",
+	"/run/docker.sock",
+	"/docker.sock", // Sometimes mounted here in containers
+}
+
+// Host paths bind-mounted read-only into the Docker Bench container when they exist
+var dockerBenchOptionalMounts = []string{
+	"/lib/systemd/system",
+	"/usr/bin/containerd",
+	"/usr/bin/runc",
+	"/usr/lib/systemd",
+}
+
 // DockerBenchScanner handles Docker Bench for Security scanning
 type DockerBenchScanner struct {
 	logger    *logrus.Logger
@@ -54,8 +115,9 @@ func (s *DockerBenchScanner) checkAvailability() {
 		return
 	}
 
-	// Check if Docker daemon is running
-	cmd := exec.Command(dockerBinary, "info")
+	// Check if Docker daemon is running. Only the exit status matters: Run leaves
+	// stdout/stderr on the null device, and --format skips rendering the full report
+	cmd := exec.Command(dockerBinary, "info", "--format", "{{.ID}}")
 	if err := cmd.Run(); err != nil {
 		s.logger.Debug("Docker daemon not responding")
 		s.available = false
@@ -76,8 +138,9 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 
 	s.logger.WithField("image", dockerBenchImage).Info("Pulling Docker Bench for Security image...")
 
-	// Pull the latest Docker Bench image
-	pullCmd := exec.CommandContext(ctx, dockerBinary, "pull", dockerBenchImage)
+	// Pull the latest Docker Bench image. --quiet drops the per-layer progress
+	// output, which is never used; errors still reach the captured output
+	pullCmd := exec.CommandContext(ctx, dockerBinary, "pull", "--quiet", dockerBenchImage)
 	if output, err := pullCmd.CombinedOutput(); err != nil {
 		s.logger.WithError(err).WithField("output", string(output)).Warn("Failed to pull Docker Bench image, attempting to use existing image")
 
@@ -104,11 +167,6 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 
 	// Find the Docker socket - check common locations
 	dockerSocket := ""
-	socketPaths := []string{
-		"/var/run/docker.sock",
-		"/run/docker.sock",
-		"/docker.sock", // Sometimes mounted here in containers
-	}
 
 	// Check DOCKER_HOST environment variable first
 	if dockerHost := os.Getenv("DOCKER_HOST"); dockerHost != "" {
@@ -123,7 +181,7 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 
 	// If not found via env, check common paths
 	if dockerSocket == "" {
-		for _, path := range socketPaths {
+		for _, path := range dockerSocketPaths {
 			if _, err := os.Stat(path); err == nil {
 				dockerSocket = path
 				s.logger.WithField("socket", dockerSocket).Info("Found Docker socket")
@@ -153,23 +211,15 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 		dockerSocket + ":/var/run/docker.sock", // Map found socket to expected location in container
 	}
 
-	// Optional mounts - only add if path exists
-	optionalMounts := map[string]string{
-		"/lib/systemd/system": "/lib/systemd/system:/lib/systemd/system:ro",
-		"/usr/bin/containerd": "/usr/bin/containerd:/usr/bin/containerd:ro",
-		"/usr/bin/runc":       "/usr/bin/runc:/usr/bin/runc:ro",
-		"/usr/lib/systemd":    "/usr/lib/systemd:/usr/lib/systemd:ro",
-	}
-
 	// Add required mounts
 	for _, mount := range requiredMounts {
 		args = append(args, "-v", mount)
 	}
 
 	// Add optional mounts only if source path exists
-	for path, mount := range optionalMounts {
+	for _, path := range dockerBenchOptionalMounts {
 		if _, err := os.Stat(path); err == nil {
-			args = append(args, "-v", mount)
+			args = append(args, "-v", path+":"+path+":ro")
 		} else {
 			s.logger.WithField("path", path).Debug("Optional mount path not found, skipping")
 		}
@@ -181,10 +231,36 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 	s.logger.WithField("command", "docker "+strings.Join(args, " ")).Info("Running Docker Bench for Security...")
 
 	cmd := exec.CommandContext(ctx, dockerBinary, args...)
-	output, err := cmd.CombinedOutput()
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		return nil, fmt.Errorf("failed to capture Docker Bench output: %w", err)
+	}
+	// Interleave stderr with stdout, as the container log is written
+	cmd.Stderr = cmd.Stdout
+	if err := cmd.Start(); err != nil {
+		return nil, fmt.Errorf("failed to start Docker Bench: %w", err)
+	}
 
-	outputStr := string(output)
-	outputLen := len(outputStr)
+	// Parse the output as it streams in rather than buffering the whole
+	// log; only a short preview is kept for diagnostics
+	parser := s.newParser(0)
+	reader := bufio.NewReader(stdout)
+	var preview strings.Builder
+	outputLen := 0
+	for {
+		line, readErr := reader.ReadString('\n')
+		outputLen += len(line)
+		if preview.Len() < dockerBenchPreviewLen {
+			preview.WriteString(line)
+		}
+		if line != "" {
+			parser.parseLine(strings.TrimSuffix(line, "\n"))
+		}
+		if readErr != nil {
+			break
+		}
+	}
+	err = cmd.Wait()
 
 	if err != nil {
 		if ctx.Err() != nil {
@@ -197,27 +273,20 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 	// Log output for debugging if it's short (likely an error)
 	if outputLen == 0 {
 		s.logger.Warn("Docker Bench produced no output - container may have failed to start")
-	} else if outputLen < 500 {
-		s.logger.WithField("output", logutil.Sanitize(outputStr)).Debug("Docker Bench produced short output")
+	} else if outputLen < dockerBenchPreviewLen {
+		s.logger.WithField("output", logutil.Sanitize(preview.String())).Debug("Docker Bench produced short output")
 	} else {
 		s.logger.WithField("output_length", outputLen).Debug("Docker Bench output captured")
 	}
 
-	// Parse the output
-	scan := s.parseOutput(outputStr)
-	scan.StartedAt = startTime
-	now := time.Now()
-	scan.CompletedAt = &now
-	scan.Status = "completed"
+	scan := parser.finish()
+	markCompleted(scan, startTime)
 
 	// Log warning if no results were parsed
 	if scan.TotalRules == 0 && outputLen > 0 {
-		// Log first 500 chars to help debug parsing issues
-		preview := outputStr
-		if len(preview) > 500 {
-			preview = preview[:500] + "..."
-		}
-		s.logger.WithField("output_preview", logutil.Sanitize(preview)).Warn("Docker Bench output received but no rules parsed - check output format")
+		// Log the start of the output to help debug parsing issues
+		previewStr := truncateString(preview.String(), dockerBenchPreviewLen)
+		s.logger.WithField("output_preview", logutil.Sanitize(previewStr)).Warn("Docker Bench output received but no rules parsed - check output format")
 	}
 
 	return scan, nil
@@ -225,178 +294,195 @@ func (s *DockerBenchScanner) RunScan(ctx context.Context) (*models.ComplianceSca
 
 // parseOutput parses Docker Bench output
 func (s *DockerBenchScanner) parseOutput(output string) *models.ComplianceScan {
-	scan := &models.ComplianceScan{
-		ProfileName: "Docker Bench for Security",
-		ProfileType: "docker-bench",
-		Results:     make([]models.ComplianceResult, 0),
-	}
-
-	// Debug: track status counts as we parse
-	debugStatusCounts := map[string]int{}
-
-	// Parse patterns
-	// [PASS] 1.1.1 - Ensure a separate partition for containers has been created
-	// [WARN] 1.1.2 - Ensure only trusted users are allowed to control Docker daemon
-	// [INFO] 1.1.3 - Ensure auditing is configured for the Docker daemon
-	// [NOTE] 4.5 - Ensure Content trust for Docker is Enabled
-
-	patterns := map[string]*regexp.Regexp{
-		"pass": regexp.MustCompile(`\[PASS\]\s+(\d+\.\d+(?:\.\d+)?)\s+-\s+(.+)`),
-		"warn": regexp.MustCompile(`\[WARN\]\s+(\d+\.\d+(?:\.\d+)?)\s+-\s+(.+)`),
-		"info": regexp.MustCompile(`\[INFO\]\s+(\d+\.\d+(?:\.\d+)?)\s+-\s+(.+)`),
-		"note": regexp.MustCompile(`\[NOTE\]\s+(\d+\.\d+(?:\.\d+)?)\s+-\s+(.+)`),
-	}
-
-	// Pattern for remediation lines (printed with -p flag)
-	remediationPattern := regexp.MustCompile(`^\s+\*\s+Remediation:\s*(.+)`)
-	// Pattern for detail/finding lines
-	detailPattern := regexp.MustCompile(`^\s+\*\s+(.+)`)
-	// Pattern for continuation lines (indented text without bullet)
-	continuationPattern := regexp.MustCompile(`^\s{6,}(.+)`)
-
-	scanner := bufio.NewScanner(strings.NewReader(output))
-	currentSection := ""
-	var lastResultIdx = -1
-	inRemediation := false // Track if we're reading multi-line remediation
-
-	for scanner.Scan() {
-		line := scanner.Text()
-
-		// Check for remediation line (follows a check result)
-		if lastResultIdx >= 0 {
-			if matches := remediationPattern.FindStringSubmatch(line); matches != nil {
-				scan.Results[lastResultIdx].Remediation = strings.TrimSpace(matches[1])
-				inRemediation = true
-				continue
+	// Every result line starts with a "[TAG]" marker, so this bounds the result count
+	p := s.newParser(strings.Count(output, "\n[") + 1)
+
+	// Walk the output line by line in place: no per-line copies and no
+	// bufio.Scanner token limit on unusually long lines
+	rest := output
+	for rest != "" {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
+		p.parseLine(line)
+	}
+
+	return p.finish()
+}
+
+// dockerBenchParser parses Docker Bench output one line at a time, so results
+// can be collected while the container is still writing its log
+type dockerBenchParser struct {
+	s                 *DockerBenchScanner
+	scan              *models.ComplianceScan
+	debugStatusCounts map[string]int // Debug: track status counts as we parse
+	currentSection    string
+	lastResultIdx     int
+	inRemediation     bool // Track if we're reading multi-line remediation
+}
+
+// newParser creates an incremental parser with room for capacity results
+func (s *DockerBenchScanner) newParser(capacity int) *dockerBenchParser {
+	return &dockerBenchParser{
+		s: s,
+		scan: &models.ComplianceScan{
+			ProfileName: "Docker Bench for Security",
+			ProfileType: "docker-bench",
+			Results:     make([]models.ComplianceResult, 0, capacity),
+		},
+		debugStatusCounts: map[string]int{},
+		lastResultIdx:     -1,
+	}
+}
+
+// parseLine consumes a single output line, without its trailing newline
+func (p *dockerBenchParser) parseLine(line string) {
+	line = strings.TrimSuffix(line, "\r")
+
+	// Check for remediation line (follows a check result)
+	if p.lastResultIdx >= 0 {
+		bullet, isBullet := dockerBenchBullet(line)
+		if isBullet && len(bullet) > len(dockerBenchRemediationPrefix) && strings.HasPrefix(bullet, dockerBenchRemediationPrefix) {
+			p.scan.Results[p.lastResultIdx].Remediation = strings.TrimSpace(bullet[len(dockerBenchRemediationPrefix):])
+			p.inRemediation = true
+			return
+		}
+		// Check for continuation of remediation text (deeply indented lines)
+		if p.inRemediation {
+			if isDockerBenchContinuation(line) {
+				// Append to existing remediation
+				p.scan.Results[p.lastResultIdx].Remediation += " " + strings.TrimSpace(line)
+				return
+			} else if strings.TrimSpace(line) == "" {
+				// Empty line ends remediation section
+				p.inRemediation = false
+			} else if !strings.HasPrefix(strings.TrimSpace(line), "*") && !strings.HasPrefix(line, "[") {
+				// Non-bullet continuation line
+				p.scan.Results[p.lastResultIdx].Remediation += " " + strings.TrimSpace(line)
+				return
+			} else {
+				p.inRemediation = false
 			}
-			// Check for continuation of remediation text (deeply indented lines)
-			if inRemediation {
-				if matches := continuationPattern.FindStringSubmatch(line); matches != nil {
-					// Append to existing remediation
-					scan.Results[lastResultIdx].Remediation += " " + strings.TrimSpace(matches[1])
-					continue
-				} else if strings.TrimSpace(line) == "" {
-					// Empty line ends remediation section
-					inRemediation = false
-				} else if !strings.HasPrefix(strings.TrimSpace(line), "*") && !strings.HasPrefix(line, "[") {
-					// Non-bullet continuation line
-					scan.Results[lastResultIdx].Remediation += " " + strings.TrimSpace(line)
-					continue
+		}
+		// Check for detail/finding lines (e.g., "* Running as root: container_name")
+		if isBullet {
+			detail := strings.TrimSpace(bullet)
+			// Skip if it's a remediation line we already handled
+			if !strings.HasPrefix(detail, dockerBenchRemediationPrefix) {
+				if p.scan.Results[p.lastResultIdx].Finding == "" {
+					p.scan.Results[p.lastResultIdx].Finding = detail
 				} else {
-					inRemediation = false
+					p.scan.Results[p.lastResultIdx].Finding += "; " + detail
 				}
 			}
-			// Check for detail/finding lines (e.g., "* Running as root: container_name")
-			if matches := detailPattern.FindStringSubmatch(line); matches != nil {
-				detail := strings.TrimSpace(matches[1])
-				// Skip if it's a remediation line we already handled
-				if !strings.HasPrefix(detail, "Remediation:") {
-					if scan.Results[lastResultIdx].Finding == "" {
-						scan.Results[lastResultIdx].Finding = detail
-					} else {
-						scan.Results[lastResultIdx].Finding += "; " + detail
-					}
-				}
-				continue
-			}
+			return
 		}
+	}
 
-		// Detect section headers (e.g., "[INFO] 1 - Host Configuration")
-		if strings.Contains(line, "[INFO]") && !strings.Contains(line, " - ") {
-			// Section header, extract section name
-			parts := strings.SplitN(line, " ", 3)
-			if len(parts) >= 2 {
-				currentSection = strings.TrimSpace(parts[1])
-			}
-			lastResultIdx = -1
-			inRemediation = false
-			continue
+	// Section headers and results both carry a "[TAG]" marker; skip banner,
+	// blank and log lines without paying for a regex match
+	if strings.IndexByte(line, '[') < 0 {
+		return
+	}
+
+	// Detect section headers (e.g., "[INFO] 1 - Host Configuration")
+	if strings.Contains(line, "[INFO]") && !strings.Contains(line, " - ") {
+		// Section header, extract section name
+		parts := strings.SplitN(line, " ", 3)
+		if len(parts) >= 2 {
+			p.currentSection = strings.TrimSpace(parts[1])
 		}
+		p.lastResultIdx = -1
+		p.inRemediation = false
+		return
+	}
 
-		// Check each pattern
-		for status, pattern := range patterns {
-			if matches := pattern.FindStringSubmatch(line); matches != nil {
-				ruleID := matches[1]
-				title := strings.TrimSpace(matches[2])
-
-				// Map status
-				resultStatus := s.mapStatus(status)
-
-				// Debug: track what we're actually parsing
-				debugStatusCounts[resultStatus]++
-
-				// Update counters
-				switch resultStatus {
-				case "pass":
-					scan.Passed++
-				case "fail":
-					scan.Failed++
-				case "warn":
-					scan.Warnings++
-					// Debug: log when we find a warning
-					s.logger.WithFields(logrus.Fields{
-						"rule_id": ruleID,
-						"title":   title,
-						"status":  resultStatus,
-					}).Debug("Parsed Docker Bench warning")
-				case "skip":
-					scan.Skipped++
-				}
-				scan.TotalRules++
-
-				// Determine section from rule ID
-				section := s.getSectionFromID(ruleID, currentSection)
-
-				scan.Results = append(scan.Results, models.ComplianceResult{
-					RuleID:  ruleID,
-					Title:   title,
-					Status:  resultStatus,
-					Section: section,
-				})
-				lastResultIdx = len(scan.Results) - 1
-				inRemediation = false // Reset for new result
-				break
-			}
+	// Check for a result line
+	matches := dockerBenchCheckPattern.FindStringSubmatch(line)
+	if matches == nil {
+		return
+	}
+	ruleID := matches[2]
+	title := strings.TrimSpace(matches[3])
+
+	// Map status
+	resultStatus := p.s.mapStatus(matches[1])
+
+	// Debug: track what we're actually parsing
+	p.debugStatusCounts[resultStatus]++
+
+	// Update counters
+	switch resultStatus {
+	case "pass":
+		p.scan.Passed++
+	case "fail":
+		p.scan.Failed++
+	case "warn":
+		p.scan.Warnings++
+		// Debug: log when we find a warning
+		if p.s.logger.IsLevelEnabled(logrus.DebugLevel) {
+			p.s.logger.WithFields(logrus.Fields{
+				"rule_id": ruleID,
+				"title":   title,
+				"status":  resultStatus,
+			}).Debug("Parsed Docker Bench warning")
 		}
+	case "skip":
+		p.scan.Skipped++
 	}
+	p.scan.TotalRules++
+
+	// Determine section from rule ID
+	section := p.s.getSectionFromID(ruleID, p.currentSection)
+
+	p.scan.Results = append(p.scan.Results, models.ComplianceResult{
+		RuleID:  ruleID,
+		Title:   title,
+		Status:  resultStatus,
+		Section: section,
+	})
+	p.lastResultIdx = len(p.scan.Results) - 1
+	p.inRemediation = false // Reset for new result
+}
 
+// finish scores the parsed results and returns the scan
+func (p *dockerBenchParser) finish() *models.ComplianceScan {
 	// Calculate score
-	if scan.TotalRules > 0 {
-		applicable := scan.Passed + scan.Failed + scan.Warnings
+	if p.scan.TotalRules > 0 {
+		applicable := p.scan.Passed + p.scan.Failed + p.scan.Warnings
 		if applicable > 0 {
-			scan.Score = float64(scan.Passed) / float64(applicable) * 100
+			p.scan.Score = float64(p.scan.Passed) / float64(applicable) * 100
 		}
 	}
 
 	// Debug: log parsed results summary
 	resultStatusCounts := map[string]int{}
-	for _, r := range scan.Results {
+	for _, r := range p.scan.Results {
 		resultStatusCounts[r.Status]++
 	}
-	s.logger.WithFields(logrus.Fields{
-		"parse_counts":  debugStatusCounts,
+	p.s.logger.WithFields(logrus.Fields{
+		"parse_counts":  p.debugStatusCounts,
 		"result_counts": resultStatusCounts,
-		"total_results": len(scan.Results),
-		"scan_passed":   scan.Passed,
-		"scan_failed":   scan.Failed,
-		"scan_warnings": scan.Warnings,
-		"scan_skipped":  scan.Skipped,
-		"scan_total":    scan.TotalRules,
+		"total_results": len(p.scan.Results),
+		"scan_passed":   p.scan.Passed,
+		"scan_failed":   p.scan.Failed,
+		"scan_warnings": p.scan.Warnings,
+		"scan_skipped":  p.scan.Skipped,
+		"scan_total":    p.scan.TotalRules,
 	}).Info("Docker Bench parsing complete - debug status comparison")
 
-	return scan
+	return p.scan
 }
 
-// mapStatus maps Docker Bench status to our status
+// mapStatus maps a Docker Bench status tag (PASS, WARN, INFO, NOTE) to our status
 func (s *DockerBenchScanner) mapStatus(status string) string {
 	switch status {
-	case "pass":
+	case "PASS":
 		return "pass"
-	case "warn":
+	case "WARN":
 		return "warn"
-	case "info":
+	case "INFO":
 		return "skip"
-	case "note":
+	case "NOTE":
 		return "skip"
 	default:
 		return "skip"
@@ -405,30 +491,10 @@ func (s *DockerBenchScanner) mapStatus(status string) string {
 
 // getSectionFromID extracts section name from rule ID
 func (s *DockerBenchScanner) getSectionFromID(ruleID string, currentSection string) string {
-	// Docker Bench sections:
-	// 1 - Host Configuration
-	// 2 - Docker daemon configuration
-	// 3 - Docker daemon configuration files
-	// 4 - Container Images and Build File
-	// 5 - Container Runtime
-	// 6 - Docker Security Operations
-	// 7 - Docker Swarm Configuration
-
-	sections := map[string]string{
-		"1": "Host Configuration",
-		"2": "Docker Daemon Configuration",
-		"3": "Docker Daemon Configuration Files",
-		"4": "Container Images and Build File",
-		"5": "Container Runtime",
-		"6": "Docker Security Operations",
-		"7": "Docker Swarm Configuration",
-	}
-
-	// Get first digit of rule ID
+	// Index the section table directly by the first digit of the rule ID
 	if len(ruleID) > 0 {
-		firstDigit := string(ruleID[0])
-		if section, exists := sections[firstDigit]; exists {
-			return section
+		if i := int(ruleID[0] - '0'); i > 0 && i < len(dockerBenchSections) {
+			return dockerBenchSections[i]
 		}
 	}
 
@@ -449,7 +515,7 @@ func (s *DockerBenchScanner) EnsureInstalled() error {
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
 	defer cancel()
 
-	pullCmd := exec.CommandContext(ctx, dockerBinary, "pull", dockerBenchImage)
+	pullCmd := exec.CommandContext(ctx, dockerBinary, "pull", "--quiet", dockerBenchImage)
 	output, err := pullCmd.CombinedOutput()
 	if err != nil {
 		s.logger.WithError(err).WithField("output", string(output)).Warn("Failed to pull Docker Bench image")
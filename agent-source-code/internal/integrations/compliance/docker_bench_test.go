@@ -0,0 +1,126 @@
+package compliance
+
+import (
+	"io"
+	"testing"
+
+	"github.com/sirupsen/logrus"
+)
+
+func newTestDockerBenchScanner() *DockerBenchScanner {
+	log := logrus.New()
+	log.SetOutput(io.Discard)
+	return &DockerBenchScanner{logger: log}
+}
+
+const sampleDockerBenchOutput = `# --------------------------------------------------------------------------------------------
+# Docker Bench for Security v1.6.0
+# --------------------------------------------------------------------------------------------
+
+Initializing 2024-01-01T00:00:00+00:00
+
+[INFO] 1 - Host Configuration
+[INFO] 1.1 - Linux Hosts Specific Configuration
+[WARN] 1.1.1 - Ensure a separate partition for containers has been created (Automated)
+      * Remediation: For new installations, you should create a separate partition for the
+        /var/lib/docker mount point.
+
+[PASS] 1.1.2 - Ensure only trusted users are allowed to control Docker daemon (Automated)
+[INFO] 2 - Docker daemon configuration
+[NOTE] 2.1 - Run the Docker daemon as a non-root user, if possible (Manual)
+[WARN] 5.4 - Ensure that privileged containers are not used (Automated)
+     * Running in privileged mode: web
+     * Running in privileged mode: db
+
+Section C - Score
+
+[INFO] Checks: 5
+[INFO] Score: 1
+`
+
+func TestDockerBenchParseOutput(t *testing.T) {
+	s := newTestDockerBenchScanner()
+	scan := s.parseOutput(sampleDockerBenchOutput)
+
+	if scan.TotalRules != 5 {
+		t.Fatalf("TotalRules = %d, want 5", scan.TotalRules)
+	}
+	if scan.Passed != 1 || scan.Warnings != 2 || scan.Skipped != 2 {
+		t.Errorf("counts = pass %d warn %d skip %d, want 1/2/2", scan.Passed, scan.Warnings, scan.Skipped)
+	}
+
+	want := []struct {
+		ruleID, status, section string
+	}{
+		{"1.1", "skip", "Host Configuration"},
+		{"1.1.1", "warn", "Host Configuration"},
+		{"1.1.2", "pass", "Host Configuration"},
+		{"2.1", "skip", "Docker Daemon Configuration"},
+		{"5.4", "warn", "Container Runtime"},
+	}
+	for i, w := range want {
+		got := scan.Results[i]
+		if got.RuleID != w.ruleID || got.Status != w.status || got.Section != w.section {
+			t.Errorf("result %d = {%q %q %q}, want {%q %q %q}", i, got.RuleID, got.Status, got.Section, w.ruleID, w.status, w.section)
+		}
+	}
+
+	if got := scan.Results[1].Title; got != "Ensure a separate partition for containers has been created (Automated)" {
+		t.Errorf("title = %q", got)
+	}
+	wantRemediation := "For new installations, you should create a separate partition for the /var/lib/docker mount point."
+	if got := scan.Results[1].Remediation; got != wantRemediation {
+		t.Errorf("remediation = %q, want %q", got, wantRemediation)
+	}
+	if got := scan.Results[4].Finding; got != "Running in privileged mode: web; Running in privileged mode: db" {
+		t.Errorf("finding = %q", got)
+	}
+
+	// 1 pass out of 3 applicable (pass + warn)
+	if scan.Score < 33.3 || scan.Score > 33.4 {
+		t.Errorf("Score = %v, want ~33.3", scan.Score)
+	}
+}
+
+func TestDockerBenchGetSectionFromID(t *testing.T) {
+	tests := []struct {
+		ruleID, current string
+		want            string
+	}{
+		{"1.1.1", "", "Host Configuration"},
+		{"7.10", "", "Docker Swarm Configuration"},
+		// Unknown sections keep the section header seen in the output
+		{"8.1", "Kubernetes", "Kubernetes"},
+		{"0.1", "Other", "Other"},
+		{"", "Other", "Other"},
+	}
+
+	s := newTestDockerBenchScanner()
+	for _, tt := range tests {
+		if got := s.getSectionFromID(tt.ruleID, tt.current); got != tt.want {
+			t.Errorf("getSectionFromID(%q, %q) = %q, want %q", tt.ruleID, tt.current, got, tt.want)
+		}
+	}
+}
+
+func TestDockerBenchBullet(t *testing.T) {
+	tests := []struct {
+		line   string
+		want   string
+		wantOK bool
+	}{
+		{"     * Running in privileged mode: web", "Running in privileged mode: web", true},
+		{"\t*\tRemediation: fix it", "Remediation: fix it", true},
+		{"* Not indented", "", false},
+		{"     *", "", false},
+		{"     *no space", "", false},
+		{"        /var/lib/docker mount point.", "", false},
+	}
+
+	for _, tt := range tests {
+		got, ok := dockerBenchBullet(tt.line)
+		if got != tt.want || ok != tt.wantOK {
+			t.Errorf("dockerBenchBullet(%q) = %q, %v, want %q, %v", tt.line, got, ok, tt.want, tt.wantOK)
+		}
+	}
+}
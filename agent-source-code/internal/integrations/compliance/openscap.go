@@ -4,6 +4,7 @@ import (
 	"archive/zip"
 	"bufio"
 	"context"
+	"encoding/xml"
 	"errors"
 	"fmt"
 	"io"
@@ -14,6 +15,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"patchmon-agent/internal/logutil"
@@ -22,8 +24,10 @@ import (
 	"github.com/sirupsen/logrus"
 )
 
-const (
-	oscapBinary    = "oscap"
+const oscapBinary = "oscap"
+
+// Vars rather than consts so tests can point them at fixture files
+var (
 	scapContentDir = "/usr/share/xml/scap/ssg/content"
 	osReleasePath  = "/etc/os-release"
 )
@@ -61,6 +65,39 @@ var profileMappings = map[string]map[string]string{
 	},
 }
 
+// Patterns applied per rule or per output line, compiled once
+var (
+	// Rule ID in oscap stdout lines
+	oscapOutputRulePattern = regexp.MustCompile(`(xccdf_org\.ssgproject\.content_rule_[^\s\t]+)`)
+	// Section number embedded in a rule ID, like "1_1_1" or "1.1.1"
+	ruleSectionPattern = regexp.MustCompile(`(\d+[_\.]\d+(?:[_\.]\d+)*)`)
+	// HTML/XML tags and whitespace runs removed by cleanXMLText
+	xmlTagPattern        = regexp.MustCompile(`<[^>]+>`)
+	whitespaceRunPattern = regexp.MustCompile(`\s+`)
+
+	// Actual/expected value phrasing in findings (see parseActualExpected)
+	expectedButFoundPattern = regexp.MustCompile(`(?i)expected\s+['"]?([^'"]+?)['"]?\s+but\s+found\s+['"]?([^'"]+?)['"]?`)
+	foundExpectedPattern    = regexp.MustCompile(`(?i)found\s+['"]?([^'"]+?)['"]?\s+expected\s+['"]?([^'"]+?)['"]?`)
+	isSetToPattern          = regexp.MustCompile(`(?i)is\s+set\s+to\s+['"]?([^'"]+?)['"]?`)
+	shouldBePattern         = regexp.MustCompile(`(?i)should\s+be\s+['"]?([^'"]+?)['"]?`)
+	valuePattern            = regexp.MustCompile(`(?:value|=)\s*['"]?(\S+)['"]?`)
+)
+
+// Distributions that ship their own SSG content files (ssg-{name}{version}-ds.xml).
+// Matching the OS ID here means AlmaLinux uses ssg-almalinux9, not ssg-rhel9.
+var ssgSpecificDistros = map[string]bool{
+	"almalinux": true, "ol": true, "ubuntu": true, "debian": true, "centos": true,
+	"rhel": true, "rocky": true, "fedora": true, "sles": true, "opensuse": true,
+	"al2023": true, "alinux2": true, "alinux3": true,
+	// Legacy "alma" (AlmaLinux 8 and older used this in some configs)
+	"alma": true,
+}
+
+// Base distributions recognised in ID_LIKE when the OS has no content of its own
+var ssgBaseDistributions = map[string]bool{
+	"rhel": true, "centos": true, "fedora": true, "debian": true, "ubuntu": true, "suse": true,
+}
+
 // OpenSCAPScanner handles OpenSCAP compliance scanning
 type OpenSCAPScanner struct {
 	logger    *logrus.Logger
@@ -138,36 +175,18 @@ func (s *OpenSCAPScanner) DiscoverProfiles() []models.ScanProfileInfo {
 		return s.getDefaultProfiles()
 	}
 
-	// Run oscap info to get profile list
-	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
-	defer cancel()
-
-	cmd := exec.CommandContext(ctx, oscapBinary, "info", "--profiles", contentFile)
-	output, err := cmd.Output()
+	list, err := s.contentProfiles(contentFile)
 	if err != nil {
 		s.logger.WithError(err).Debug("Failed to get profiles from oscap info, using defaults")
 		return s.getDefaultProfiles()
 	}
 
-	profiles := []models.ScanProfileInfo{}
-	scanner := bufio.NewScanner(strings.NewReader(string(output)))
-
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
-			continue
-		}
-
-		// Parse profile line: "xccdf_org.ssgproject.content_profile_cis_level1_server:CIS Ubuntu 22.04 Level 1 Server Benchmark"
-		parts := strings.SplitN(line, ":", 2)
-		if len(parts) < 1 {
-			continue
-		}
-
-		xccdfID := strings.TrimSpace(parts[0])
-		name := xccdfID
-		if len(parts) == 2 {
-			name = strings.TrimSpace(parts[1])
+	profiles := make([]models.ScanProfileInfo, 0, len(list))
+	for _, p := range list {
+		xccdfID := p.id
+		name := p.name
+		if name == "" {
+			name = xccdfID
 		}
 
 		// Determine category from profile ID
@@ -940,32 +959,29 @@ func (s *OpenSCAPScanner) getInstalledSSGVersion() string {
 
 // checkAvailability checks if OpenSCAP is installed and has content
 func (s *OpenSCAPScanner) checkAvailability() {
-	// Check if oscap binary exists
-	path, err := exec.LookPath(oscapBinary)
-	if err != nil {
-		s.logger.Debug("OpenSCAP binary not found")
-		s.available = false
-		return
-	}
-	s.logger.WithField("path", path).Debug("Found OpenSCAP binary")
+	// The version probe spawns oscap while the content lookup only touches the
+	// filesystem; they are independent, so run them side by side
+	var (
+		version    string
+		versionErr error
+		wg         sync.WaitGroup
+	)
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		version, versionErr = s.probeVersion()
+	}()
 
-	// Get version
-	cmd := exec.Command(oscapBinary, "--version")
-	output, err := cmd.Output()
-	if err != nil {
-		s.logger.WithError(err).Debug("Failed to get OpenSCAP version")
+	// Check if SCAP content exists
+	contentFile := s.getContentFile()
+	wg.Wait()
+
+	if versionErr != nil {
 		s.available = false
 		return
 	}
+	s.version = version
 
-	// Parse version from output
-	lines := strings.Split(string(output), "\n")
-	if len(lines) > 0 {
-		s.version = strings.TrimSpace(lines[0])
-	}
-
-	// Check if SCAP content exists
-	contentFile := s.getContentFile()
 	if contentFile == "" {
 		s.logger.Debug("No SCAP content files found")
 		s.available = false
@@ -979,14 +995,92 @@ func (s *OpenSCAPScanner) checkAvailability() {
 	}).Debug("OpenSCAP is available")
 }
 
-// detectOS detects the operating system
-func (s *OpenSCAPScanner) detectOS() models.ComplianceOSInfo {
+// probeVersion locates the oscap binary and returns the first line of its version output
+func (s *OpenSCAPScanner) probeVersion() (string, error) {
+	// Check if oscap binary exists
+	path, err := exec.LookPath(oscapBinary)
+	if err != nil {
+		s.logger.Debug("OpenSCAP binary not found")
+		return "", err
+	}
+	s.logger.WithField("path", path).Debug("Found OpenSCAP binary")
+
+	info, err := os.Stat(path)
+	if err != nil {
+		return "", err
+	}
+
+	oscapVersionCache.Lock()
+	defer oscapVersionCache.Unlock()
+
+	c := &oscapVersionCache
+	if c.version != "" && c.path == path && c.size == info.Size() && c.modTime.Equal(info.ModTime()) {
+		return c.version, nil
+	}
+
+	// Get version
+	cmd := exec.Command(oscapBinary, "--version")
+	output, err := cmd.Output()
+	if err != nil {
+		s.logger.WithError(err).Debug("Failed to get OpenSCAP version")
+		return "", err
+	}
+
+	// Parse version from the first line of output
+	firstLine, _, _ := strings.Cut(string(output), "\n")
+	c.path = path
+	c.size = info.Size()
+	c.modTime = info.ModTime()
+	c.version = strings.TrimSpace(firstLine)
+	return c.version, nil
+}
+
+// oscapVersionCache holds the version reported by the oscap binary. Every scanner
+// construction probes the version, so the fork is skipped until the binary at
+// the resolved path is replaced (e.g. by an install or package upgrade).
+var oscapVersionCache struct {
+	sync.Mutex
+	path    string
+	size    int64
+	modTime time.Time
+	version string
+}
+
+// osRelease caches the parsed /etc/os-release. The file does not change while
+// the agent runs, so every scanner instance shares one successful read.
+var osRelease struct {
+	sync.Mutex
+	ok     bool
+	info   models.ComplianceOSInfo
+	idLike string
+}
+
+// readOSRelease parses /etc/os-release until a read succeeds and returns the
+// cached OS info and ID_LIKE value afterwards. A failed read is not cached,
+// so a transient error does not disable OS detection for the process.
+func readOSRelease() (models.ComplianceOSInfo, string, error) {
+	osRelease.Lock()
+	defer osRelease.Unlock()
+
+	if !osRelease.ok {
+		info, idLike, err := parseOSRelease(osReleasePath)
+		if err != nil {
+			return info, idLike, err
+		}
+		osRelease.info, osRelease.idLike, osRelease.ok = info, idLike, true
+	}
+	return osRelease.info, osRelease.idLike, nil
+}
+
+// parseOSRelease extracts ID, VERSION_ID and ID_LIKE from an os-release file
+// and derives the distribution family from them.
+func parseOSRelease(path string) (models.ComplianceOSInfo, string, error) {
 	info := models.ComplianceOSInfo{}
+	var idLike string
 
-	file, err := os.Open(osReleasePath)
+	file, err := os.Open(path)
 	if err != nil {
-		s.logger.WithError(err).Debug("Failed to open os-release")
-		return info
+		return info, "", err
 	}
 	defer func() {
 		if err := file.Close(); err != nil {
@@ -996,13 +1090,11 @@ func (s *OpenSCAPScanner) detectOS() models.ComplianceOSInfo {
 
 	scanner := bufio.NewScanner(file)
 	for scanner.Scan() {
-		line := scanner.Text()
-		parts := strings.SplitN(line, "=", 2)
-		if len(parts) != 2 {
+		key, value, ok := strings.Cut(scanner.Text(), "=")
+		if !ok {
 			continue
 		}
-		key := parts[0]
-		value := strings.Trim(parts[1], "\"")
+		value = strings.Trim(value, "\"")
 
 		switch key {
 		case "ID":
@@ -1011,7 +1103,7 @@ func (s *OpenSCAPScanner) detectOS() models.ComplianceOSInfo {
 			info.Version = value
 		case "ID_LIKE":
 			// Store ID_LIKE for base distribution detection
-			s.idLike = value
+			idLike = value
 			// Determine family from ID_LIKE
 			if strings.Contains(value, "debian") {
 				info.Family = "debian"
@@ -1035,6 +1127,17 @@ func (s *OpenSCAPScanner) detectOS() models.ComplianceOSInfo {
 		}
 	}
 
+	return info, idLike, nil
+}
+
+// detectOS detects the operating system
+func (s *OpenSCAPScanner) detectOS() models.ComplianceOSInfo {
+	info, idLike, err := readOSRelease()
+	if err != nil {
+		s.logger.WithError(err).Debug("Failed to open os-release")
+		return info
+	}
+	s.idLike = idLike
 	return info
 }
 
@@ -1042,36 +1145,16 @@ func (s *OpenSCAPScanner) detectOS() models.ComplianceOSInfo {
 // Prefers distribution-specific SSG content (e.g. ssg-almalinux9-ds.xml for AlmaLinux)
 // over generic RHEL content when available. Uses ID_LIKE as fallback for RHEL-based distros.
 func (s *OpenSCAPScanner) getContentOSName() string {
-	// Distribution-specific names that have their own SSG content files (ssg-{name}{version}-ds.xml).
-	// Order matters: check specific names first so AlmaLinux uses ssg-almalinux9, not ssg-rhel9.
-	specificDistros := []string{
-		"almalinux", "ol", "ubuntu", "debian", "centos", "rhel", "rocky", "fedora",
-		"sles", "opensuse", "al2023", "alinux2", "alinux3",
-	}
-	for _, base := range specificDistros {
-		if s.osInfo.Name == base {
-			return s.osInfo.Name
-		}
-	}
-
-	// Legacy "alma" (AlmaLinux 8 and older used this in some configs)
-	if s.osInfo.Name == "alma" {
-		return "alma"
+	// Check specific names first so distributions with their own content use it
+	if ssgSpecificDistros[s.osInfo.Name] {
+		return s.osInfo.Name
 	}
 
 	// Fallback: use ID_LIKE for base distribution (e.g. rhel from "rhel centos fedora")
-	baseDistributions := []string{"rhel", "centos", "fedora", "debian", "ubuntu", "suse"}
-
-	// If not, check ID_LIKE for base distributions
 	// ID_LIKE typically contains space-separated values like "ubuntu debian" or "rhel fedora"
-	if s.idLike != "" {
-		idLikeParts := strings.Fields(s.idLike)
-		for _, part := range idLikeParts {
-			for _, base := range baseDistributions {
-				if part == base {
-					return base
-				}
-			}
+	for _, part := range strings.Fields(s.idLike) {
+		if ssgBaseDistributions[part] {
+			return part
 		}
 	}
 
@@ -1085,48 +1168,61 @@ func (s *OpenSCAPScanner) getContentFile() string {
 		return ""
 	}
 
-	// Get the base distribution name for content file lookup
-	contentOSName := s.getContentOSName()
-
-	// Build possible content file names
-	patterns := []string{
-		fmt.Sprintf("ssg-%s%s-ds.xml", contentOSName, strings.ReplaceAll(s.osInfo.Version, ".", "")),
-		fmt.Sprintf("ssg-%s%s-ds.xml", contentOSName, strings.Split(s.osInfo.Version, ".")[0]),
-		fmt.Sprintf("ssg-%s-ds.xml", contentOSName),
+	// List the content directory once and match candidates against the names,
+	// rather than a stat per candidate plus a glob per OS name
+	entries, err := os.ReadDir(scapContentDir)
+	if err != nil {
+		return ""
 	}
-
-	// Check each pattern
-	for _, pattern := range patterns {
-		path := filepath.Join(scapContentDir, pattern)
-		if _, err := os.Stat(path); err == nil {
-			return path
+	names := make([]string, 0, len(entries))
+	for _, entry := range entries {
+		if !entry.IsDir() {
+			names = append(names, entry.Name())
 		}
 	}
 
-	// Try to find any matching file; when multiple exist, prefer the one that matches OS version
-	matches, err := filepath.Glob(filepath.Join(scapContentDir, fmt.Sprintf("ssg-%s*-ds.xml", contentOSName)))
-	if err == nil && len(matches) > 0 {
-		return s.bestContentMatch(matches, contentOSName)
+	// Get the base distribution name for content file lookup
+	contentOSName := s.getContentOSName()
+	if path := s.findContentFile(names, contentOSName); path != "" {
+		return path
 	}
 
 	// If still not found and we normalized to a base distribution, try the original OS name as fallback
 	if contentOSName != s.osInfo.Name {
-		patterns = []string{
-			fmt.Sprintf("ssg-%s%s-ds.xml", s.osInfo.Name, strings.ReplaceAll(s.osInfo.Version, ".", "")),
-			fmt.Sprintf("ssg-%s%s-ds.xml", s.osInfo.Name, strings.Split(s.osInfo.Version, ".")[0]),
-			fmt.Sprintf("ssg-%s-ds.xml", s.osInfo.Name),
-		}
-		for _, pattern := range patterns {
-			path := filepath.Join(scapContentDir, pattern)
-			if _, err := os.Stat(path); err == nil {
-				return path
+		return s.findContentFile(names, s.osInfo.Name)
+	}
+
+	return ""
+}
+
+// findContentFile picks the content file for osName from the content directory
+// listing: exact version, then major version, then unversioned, then the best of
+// any ssg-{osName}*-ds.xml files.
+func (s *OpenSCAPScanner) findContentFile(names []string, osName string) string {
+	candidates := []string{
+		fmt.Sprintf("ssg-%s%s-ds.xml", osName, strings.ReplaceAll(s.osInfo.Version, ".", "")),
+		fmt.Sprintf("ssg-%s%s-ds.xml", osName, strings.Split(s.osInfo.Version, ".")[0]),
+		fmt.Sprintf("ssg-%s-ds.xml", osName),
+	}
+	for _, candidate := range candidates {
+		for _, name := range names {
+			if name == candidate {
+				return filepath.Join(scapContentDir, name)
 			}
 		}
-		matches, err := filepath.Glob(filepath.Join(scapContentDir, fmt.Sprintf("ssg-%s*-ds.xml", s.osInfo.Name)))
-		if err == nil && len(matches) > 0 {
-			return s.bestContentMatch(matches, s.osInfo.Name)
+	}
+
+	// Try to find any matching file; when multiple exist, prefer the one that matches OS version
+	pattern := fmt.Sprintf("ssg-%s*-ds.xml", osName)
+	var matches []string
+	for _, name := range names {
+		if ok, _ := filepath.Match(pattern, name); ok {
+			matches = append(matches, filepath.Join(scapContentDir, name))
 		}
 	}
+	if len(matches) > 0 {
+		return s.bestContentMatch(matches, osName)
+	}
 
 	return ""
 }
@@ -1226,6 +1322,77 @@ func (s *OpenSCAPScanner) getProfileID(profileName string) string {
 	return ""
 }
 
+// contentProfile is one entry of `oscap info --profiles` output
+type contentProfile struct {
+	id   string
+	name string
+}
+
+// contentProfilesCache holds the profile list of the last content file queried.
+// Listing profiles spawns oscap and loads the whole datastream, and both profile
+// discovery and every scan need it, so the list is reused until the file's size
+// or mtime changes.
+var contentProfilesCache struct {
+	sync.Mutex
+	path     string
+	size     int64
+	modTime  time.Time
+	profiles []contentProfile
+}
+
+// contentProfiles returns the profiles declared in contentFile, running
+// `oscap info --profiles` only when the file changed since the last call
+func (s *OpenSCAPScanner) contentProfiles(contentFile string) ([]contentProfile, error) {
+	info, err := os.Stat(contentFile)
+	if err != nil {
+		return nil, err
+	}
+
+	contentProfilesCache.Lock()
+	defer contentProfilesCache.Unlock()
+
+	c := &contentProfilesCache
+	if c.profiles != nil && c.path == contentFile && c.size == info.Size() && c.modTime.Equal(info.ModTime()) {
+		return c.profiles, nil
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+	defer cancel()
+	cmd := exec.CommandContext(ctx, oscapBinary, "info", "--profiles", contentFile)
+	output, err := cmd.Output()
+	if err != nil {
+		return nil, err
+	}
+
+	profiles := parseProfileList(string(output))
+	c.path = contentFile
+	c.size = info.Size()
+	c.modTime = info.ModTime()
+	c.profiles = profiles
+	return profiles, nil
+}
+
+// parseProfileList parses `oscap info --profiles` output, one profile per line:
+// "xccdf_org.ssgproject.content_profile_cis_level1_server:CIS Ubuntu 22.04 Level 1 Server Benchmark"
+func parseProfileList(output string) []contentProfile {
+	profiles := make([]contentProfile, 0, strings.Count(output, "\n")+1)
+	rest := output
+	for rest != "" {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
+		line = strings.TrimSpace(line)
+		if line == "" {
+			continue
+		}
+		id, name, _ := strings.Cut(line, ":")
+		profiles = append(profiles, contentProfile{
+			id:   strings.TrimSpace(id),
+			name: strings.TrimSpace(name),
+		})
+	}
+	return profiles
+}
+
 // getProfileIDFromContent resolves the profile ID actually present in the content file.
 // Some datastreams (e.g. ssg-debian13-ds.xml) do not ship CIS profiles and only have
 // ANSSI/standard; this asks oscap for the list and returns a matching ID, or falls back
@@ -1234,44 +1401,22 @@ func (s *OpenSCAPScanner) getProfileIDFromContent(contentFile string, preferredI
 	if contentFile == "" || preferredID == "" {
 		return preferredID
 	}
-	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
-	defer cancel()
-	cmd := exec.CommandContext(ctx, oscapBinary, "info", "--profiles", contentFile)
-	output, err := cmd.Output()
+	list, err := s.contentProfiles(contentFile)
 	if err != nil {
 		s.logger.WithError(err).Debug("Could not get profiles from content, using preferred ID")
 		return preferredID
 	}
-	type profileEntry struct {
-		id   string
-		name string
-	}
-	var list []profileEntry
-	scanner := bufio.NewScanner(strings.NewReader(string(output)))
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
-			continue
-		}
-		parts := strings.SplitN(line, ":", 2)
-		if len(parts) < 1 {
-			continue
-		}
-		id := strings.TrimSpace(parts[0])
-		name := ""
-		if len(parts) == 2 {
-			name = strings.TrimSpace(parts[1])
-		}
-		list = append(list, profileEntry{id: id, name: name})
-	}
 	if len(list) == 0 {
 		return preferredID
 	}
-	// Prefer exact or CIS match (workstation vs server must match to avoid wrong profile)
+	// An exact match wins outright, before any fuzzy CIS matching
 	for _, p := range list {
 		if p.id == preferredID {
 			return p.id
 		}
+	}
+	// Prefer a CIS match (workstation vs server must match to avoid wrong profile)
+	for _, p := range list {
 		// Workstation profiles
 		if strings.HasSuffix(p.id, "cis_level1_workstation") && strings.HasSuffix(preferredID, "cis_level1_workstation") {
 			return p.id
@@ -1342,6 +1487,14 @@ func (s *OpenSCAPScanner) RunScanWithOptions(ctx context.Context, options *model
 	// Resolve to the profile ID actually in the content (e.g. Debian 13 datastream may use different IDs)
 	profileID = s.getProfileIDFromContent(contentFile, profileID)
 
+	// Only a plain profile evaluation can stand in for a later one; fingerprint
+	// its inputs before oscap runs so changes made during the scan count as new
+	var resultKey scanResultKey
+	reusable := !options.EnableRemediation && options.RuleID == "" && options.TailoringFile == "" && !options.FetchRemoteResources
+	if reusable {
+		resultKey, reusable = newScanResultKey(contentFile, options.ProfileID)
+	}
+
 	// Create temp file for results
 	resultsFile, err := os.CreateTemp("", "oscap-results-*.xml")
 	if err != nil {
@@ -1436,11 +1589,14 @@ func (s *OpenSCAPScanner) RunScanWithOptions(ctx context.Context, options *model
 	output, err := cmd.CombinedOutput()
 	close(done)
 
+	// Convert once; the byte slice is dead after this and every later use reads the string
+	outputStr := string(output)
+
 	elapsed := time.Since(startTime)
 	s.logger.WithFields(logrus.Fields{
 		"elapsed_seconds": elapsed.Seconds(),
 		"results_path":    resultsPath,
-		"output_length":   len(output),
+		"output_length":   len(outputStr),
 	}).Info("OpenSCAP command completed")
 
 	// Check if results file exists and has content
@@ -1463,11 +1619,11 @@ func (s *OpenSCAPScanner) RunScanWithOptions(ctx context.Context, options *model
 			// Exit code 1 or 2 means there were rule failures - this is normal
 			if exitErr.ExitCode() != 2 && exitErr.ExitCode() != 1 {
 				// Truncate output for error message (keep first 500 chars)
-				outputStr := string(output)
-				if len(outputStr) > 500 {
-					outputStr = outputStr[:500] + "... (truncated)"
+				errOutput := outputStr
+				if len(errOutput) > 500 {
+					errOutput = errOutput[:500] + "... (truncated)"
 				}
-				return nil, fmt.Errorf("oscap execution failed (exit code %d): %s", exitErr.ExitCode(), outputStr)
+				return nil, fmt.Errorf("oscap execution failed (exit code %d): %s", exitErr.ExitCode(), errOutput)
 			}
 		} else {
 			// Other errors (like signal killed)
@@ -1478,7 +1634,6 @@ func (s *OpenSCAPScanner) RunScanWithOptions(ctx context.Context, options *model
 	// Verify results file was written
 	if fileInfo, statErr := os.Stat(resultsPath); statErr == nil {
 		if fileInfo.Size() == 0 {
-			outputStr := string(output)
 			s.logger.Warn("Results file is empty - scan may not have run correctly (run agent as root for full evaluation)")
 			if len(outputStr) > 0 {
 				preview := outputStr
@@ -1496,7 +1651,7 @@ func (s *OpenSCAPScanner) RunScanWithOptions(ctx context.Context, options *model
 	}
 
 	// Parse results (pass oscap output and content file for metadata)
-	scan, err := s.parseResults(resultsPath, contentFile, options.ProfileID, string(output))
+	scan, err := s.parseResults(resultsPath, contentFile, options.ProfileID, outputStr)
 	if err != nil {
 		return nil, fmt.Errorf("failed to parse results: %w", err)
 	}
@@ -1511,15 +1666,127 @@ func (s *OpenSCAPScanner) RunScanWithOptions(ctx context.Context, options *model
 		"warnings":       scan.Warnings,
 	}).Debug("Parsed scan results summary")
 
-	scan.StartedAt = startTime
-	now := time.Now()
-	scan.CompletedAt = &now
-	scan.Status = "completed"
+	markCompleted(scan, startTime)
 	scan.RemediationApplied = options.EnableRemediation
 
+	if reusable {
+		storeScanResult(resultKey, scan)
+	}
+
 	return scan, nil
 }
 
+// scanResultCache holds the last plain profile scan together with the inputs
+// it was evaluated against. Scheduled scans use it to skip a multi-minute oscap
+// run when nothing those inputs cover has changed since a recent scan.
+var scanResultCache struct {
+	sync.Mutex
+	key  scanResultKey
+	scan *models.ComplianceScan
+	at   time.Time
+}
+
+// scanResultKey identifies the SCAP content, profile and installed package
+// set a scan ran against
+type scanResultKey struct {
+	contentPath     string
+	contentSize     int64
+	contentModTime  time.Time
+	profile         string
+	packagesModTime time.Time
+}
+
+// packageDatabases are the installed-package databases of the supported
+// package managers; each is rewritten whenever packages change
+var packageDatabases = []string{
+	"/var/lib/dpkg/status",
+	"/var/lib/rpm/rpmdb.sqlite",
+	"/var/lib/rpm/Packages",
+	"/usr/lib/sysimage/rpm/rpmdb.sqlite",
+	"/lib/apk/db/installed",
+	"/var/lib/pacman/local",
+}
+
+// newScanResultKey fingerprints a scan of profile against contentFile. It
+// reports false when the content file or package database can't be read, in
+// which case the scan must not be reused.
+func newScanResultKey(contentFile, profile string) (scanResultKey, bool) {
+	info, err := os.Stat(contentFile)
+	if err != nil {
+		return scanResultKey{}, false
+	}
+	key := scanResultKey{
+		contentPath:    contentFile,
+		contentSize:    info.Size(),
+		contentModTime: info.ModTime(),
+		profile:        profile,
+	}
+	for _, path := range packageDatabases {
+		if dbInfo, err := os.Stat(path); err == nil && dbInfo.ModTime().After(key.packagesModTime) {
+			key.packagesModTime = dbInfo.ModTime()
+		}
+	}
+	return key, !key.packagesModTime.IsZero()
+}
+
+// copyScan returns a copy of scan that shares no Results with it
+func copyScan(scan *models.ComplianceScan) *models.ComplianceScan {
+	cp := *scan
+	if scan.Results != nil {
+		cp.Results = make([]models.ComplianceResult, len(scan.Results))
+		copy(cp.Results, scan.Results)
+	}
+	return &cp
+}
+
+// storeScanResult records a copy of scan as the result for key, so later
+// changes to the caller's scan don't reach the cache
+func storeScanResult(key scanResultKey, scan *models.ComplianceScan) {
+	scanResultCache.Lock()
+	defer scanResultCache.Unlock()
+
+	scanResultCache.key = key
+	scanResultCache.scan = copyScan(scan)
+	scanResultCache.at = time.Now()
+}
+
+// cachedScanResult returns a copy of the stored scan when it was made for key
+// less than maxAge ago, or nil otherwise. The copy keeps the original
+// StartedAt/CompletedAt: they record when oscap actually evaluated the host.
+func cachedScanResult(key scanResultKey, maxAge time.Duration) *models.ComplianceScan {
+	scanResultCache.Lock()
+	defer scanResultCache.Unlock()
+
+	c := &scanResultCache
+	if c.scan == nil || c.key != key || time.Since(c.at) >= maxAge {
+		return nil
+	}
+	return copyScan(c.scan)
+}
+
+// RunScanReusing runs a plain scan of profileName, unless the previous plain
+// scan of it ran less than maxAge ago against the same SCAP content and
+// installed packages; a copy of that result is returned instead. The copy
+// keeps the original run's timestamps on purpose, so it reads as the earlier
+// evaluation it is: uploaded unchanged it becomes a heartbeat that re-stamps
+// the server's row, and never a fresh-looking scan. Configuration drift
+// outside the package set goes unseen until maxAge has passed, so maxAge
+// should stay well below the scan interval.
+func (s *OpenSCAPScanner) RunScanReusing(ctx context.Context, profileName string, maxAge time.Duration) (*models.ComplianceScan, error) {
+	if s.available && maxAge > 0 {
+		if key, ok := newScanResultKey(s.getContentFile(), profileName); ok {
+			if scan := cachedScanResult(key, maxAge); scan != nil {
+				s.logger.WithFields(logrus.Fields{
+					"profile":    profileName,
+					"scanned_at": scan.StartedAt,
+				}).Info("SCAP content and installed packages unchanged since last scan; reusing its results")
+				return scan, nil
+			}
+		}
+	}
+	return s.RunScan(ctx, profileName)
+}
+
 // GenerateRemediationScript generates a shell script to fix failed rules
 func (s *OpenSCAPScanner) GenerateRemediationScript(ctx context.Context, resultsPath string, outputPath string) error {
 	if !s.available {
@@ -1601,141 +1868,396 @@ type ruleMetadata struct {
 	Section     string
 }
 
+// xccdfInnerXML captures an element's raw inner markup, which may contain
+// XHTML formatting that cleanXMLText strips.
+type xccdfInnerXML struct {
+	Inner string `xml:",innerxml"`
+}
+
+// xccdfFix is a <fix> element with its remediation system attribute
+type xccdfFix struct {
+	System string `xml:"system,attr"`
+	Inner  string `xml:",innerxml"`
+}
+
+// xccdfRule is the subset of an XCCDF <Rule> element used for result metadata.
+// Tags carry no namespace so XCCDF 1.1 and 1.2 documents both match.
+type xccdfRule struct {
+	ID           string          `xml:"id,attr"`
+	Severity     string          `xml:"severity,attr"`
+	Titles       []xccdfInnerXML `xml:"title"`
+	Descriptions []xccdfInnerXML `xml:"description"`
+	Rationales   []xccdfInnerXML `xml:"rationale"`
+	Fixes        []xccdfFix      `xml:"fix"`
+	FixTexts     []xccdfInnerXML `xml:"fixtext"`
+}
+
+// xccdfRuleResult holds the fields read from a TestResult <rule-result> element.
+// XCCDF places <result> and <message> directly under <rule-result>, so only
+// direct children are decoded; <check> and other subtrees are skipped.
+type xccdfRuleResult struct {
+	IDRef    string   `xml:"idref,attr"`
+	Result   string   `xml:"result"`
+	Messages []string `xml:"message"`
+}
+
+// xccdfReadBufferSize is the read buffer used when streaming XCCDF documents
+const xccdfReadBufferSize = 64 * 1024
+
+// decodeXCCDFResults streams an XCCDF results document in a single pass,
+// collecting metadata for every embedded <Rule> and the outcome of every
+// <rule-result>. Elements are decoded one at a time, so memory use is bounded
+// by the largest single element rather than the whole (multi-MB) document.
+// Elements are matched on their exact local name whatever the namespace prefix
+// (e.g. "xccdf-1.2:Rule" in SCAP datastreams), and Rule fields are read from
+// direct children only. With skipRules set, <Rule> subtrees are skipped
+// without being decoded. On a decode error the data gathered so far is
+// returned alongside the error.
+func (s *OpenSCAPScanner) decodeXCCDFResults(r io.Reader, skipRules bool) (map[string]ruleMetadata, []xccdfRuleResult, error) {
+	metadata := make(map[string]ruleMetadata)
+	var ruleResults []xccdfRuleResult
+
+	// Datastreams and results files run to tens of megabytes; a larger buffer
+	// than the decoder's default 4 KiB cuts the read syscalls while streaming
+	decoder := xml.NewDecoder(bufio.NewReaderSize(r, xccdfReadBufferSize))
+	// XCCDF descriptions embed XHTML which may use HTML entities such as &nbsp;
+	decoder.Strict = false
+	decoder.Entity = xml.HTMLEntity
+
+	for {
+		token, err := decoder.Token()
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			return metadata, ruleResults, err
+		}
+		start, ok := token.(xml.StartElement)
+		if !ok {
+			continue
+		}
+
+		switch start.Name.Local {
+		case "Rule":
+			if skipRules {
+				if err := decoder.Skip(); err != nil {
+					return metadata, ruleResults, err
+				}
+				continue
+			}
+			var rule xccdfRule
+			if err := decoder.DecodeElement(&rule, &start); err != nil {
+				return metadata, ruleResults, err
+			}
+			if rule.ID == "" {
+				continue
+			}
+			meta := s.ruleMetadataFromXCCDF(&rule)
+			metadata[rule.ID] = meta
+			s.logRuleMetadata(rule.ID, meta)
+
+		case "rule-result":
+			var ruleResult xccdfRuleResult
+			if err := decoder.DecodeElement(&ruleResult, &start); err != nil {
+				return metadata, ruleResults, err
+			}
+			if ruleResult.IDRef != "" {
+				ruleResults = append(ruleResults, ruleResult)
+			}
+		}
+	}
+
+	if !skipRules {
+		s.logRuleMetadataSummary(metadata)
+	}
+	return metadata, ruleResults, nil
+}
+
+// ruleMetadataFromXCCDF converts a decoded <Rule> into ruleMetadata
+func (s *OpenSCAPScanner) ruleMetadataFromXCCDF(rule *xccdfRule) ruleMetadata {
+	meta := ruleMetadata{
+		Severity: rule.Severity,
+	}
+
+	// Extract title
+	for _, title := range rule.Titles {
+		if meta.Title = s.cleanXMLText(title.Inner); meta.Title != "" {
+			break
+		}
+	}
+
+	// Extract description
+	if len(rule.Descriptions) > 0 {
+		meta.Description = s.cleanXMLText(rule.Descriptions[0].Inner)
+	}
+
+	// Extract rationale (append to description if present)
+	if len(rule.Rationales) > 0 {
+		rationale := s.cleanXMLText(rule.Rationales[0].Inner)
+		if rationale != "" {
+			if meta.Description != "" {
+				meta.Description = meta.Description + "\n\nRationale: " + rationale
+			} else {
+				meta.Description = "Rationale: " + rationale
+			}
+		}
+	}
+
+	// Extract fix/remediation - prefer shell script fix, then any fix, then fixtext
+	for _, fix := range rule.Fixes {
+		if fix.System == "urn:xccdf:fix:script:sh" {
+			meta.Remediation = s.cleanXMLText(fix.Inner)
+			break
+		}
+	}
+	if meta.Remediation == "" && len(rule.Fixes) > 0 {
+		meta.Remediation = s.cleanXMLText(rule.Fixes[0].Inner)
+	}
+	if meta.Remediation == "" && len(rule.FixTexts) > 0 {
+		meta.Remediation = s.cleanXMLText(rule.FixTexts[0].Inner)
+	}
+
+	// Extract section from rule ID (e.g., "1.1.1" from rule naming)
+	meta.Section = s.extractSection(rule.ID)
+
+	return meta
+}
+
+// benchmarkMetadataCache holds the rule metadata index extracted from a SCAP
+// datastream. The datastream is several MB and only changes when SSG content
+// is upgraded, so the index is built once per content file and reused by
+// later scans until the file's size or mtime changes.
+var benchmarkMetadataCache struct {
+	sync.Mutex
+	path    string
+	size    int64
+	modTime time.Time
+	rules   map[string]ruleMetadata
+}
+
+// benchmarkRuleMetadata returns the rule metadata index for the benchmark
+// (ssg-*-ds.xml) file, which contains Rule definitions with title,
+// description, etc. The returned map is shared and must not be modified.
+func (s *OpenSCAPScanner) benchmarkRuleMetadata(contentFile string) map[string]ruleMetadata {
+	info, err := os.Stat(contentFile)
+	if err != nil {
+		s.logger.WithError(err).Warn("Failed to read benchmark file for metadata")
+		return nil
+	}
+
+	benchmarkMetadataCache.Lock()
+	defer benchmarkMetadataCache.Unlock()
+
+	c := &benchmarkMetadataCache
+	if benchmarkMetadataCurrent(contentFile, info) {
+		s.logger.WithField("content_file", contentFile).Debug("Using cached benchmark metadata")
+		return c.rules
+	}
+
+	benchmarkFile, err := os.Open(contentFile)
+	if err != nil {
+		s.logger.WithError(err).Warn("Failed to read benchmark file for metadata")
+		return nil
+	}
+	defer func() {
+		if err := benchmarkFile.Close(); err != nil {
+			_ = err
+		}
+	}()
+	s.logger.WithField("content_file", contentFile).Debug("Loaded benchmark file for metadata extraction")
+
+	// The datastream carries no rule results; only its Rule definitions are kept
+	rules, _, err := s.decodeXCCDFResults(benchmarkFile, false)
+	if err != nil {
+		s.logger.WithError(err).Warn("Benchmark file is not well-formed XML, using partially parsed metadata")
+	}
+
+	c.rules = rules
+	c.path = contentFile
+	c.size = info.Size()
+	c.modTime = info.ModTime()
+	return c.rules
+}
+
+// benchmarkMetadataCurrent reports whether the cached index was built from
+// contentFile as it is now. The caller must hold benchmarkMetadataCache.
+func benchmarkMetadataCurrent(contentFile string, info os.FileInfo) bool {
+	c := &benchmarkMetadataCache
+	return c.rules != nil && c.path == contentFile && c.size == info.Size() && c.modTime.Equal(info.ModTime())
+}
+
+// cachedBenchmarkRuleMetadata returns the cached rule index for contentFile
+// without building one, or nil when nothing current is cached
+func cachedBenchmarkRuleMetadata(contentFile string) map[string]ruleMetadata {
+	if contentFile == "" {
+		return nil
+	}
+	info, err := os.Stat(contentFile)
+	if err != nil {
+		return nil
+	}
+
+	benchmarkMetadataCache.Lock()
+	defer benchmarkMetadataCache.Unlock()
+
+	if !benchmarkMetadataCurrent(contentFile, info) {
+		return nil
+	}
+	return benchmarkMetadataCache.rules
+}
+
+// storeBenchmarkRuleMetadata records rules, decoded from the benchmark that oscap
+// embeds in its results, as the index for the content file the scan ran against
+func storeBenchmarkRuleMetadata(contentFile string, rules map[string]ruleMetadata) {
+	info, err := os.Stat(contentFile)
+	if err != nil {
+		return
+	}
+
+	benchmarkMetadataCache.Lock()
+	defer benchmarkMetadataCache.Unlock()
+
+	c := &benchmarkMetadataCache
+	c.rules = rules
+	c.path = contentFile
+	c.size = info.Size()
+	c.modTime = info.ModTime()
+}
+
 // parseResults parses the XCCDF results file and extracts rich metadata from the benchmark
 func (s *OpenSCAPScanner) parseResults(resultsPath string, contentFile string, profileName string, oscapOutput string) (*models.ComplianceScan, error) {
-	data, err := os.ReadFile(resultsPath)
+	resultsFile, err := os.Open(resultsPath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read results: %w", err)
 	}
+	defer func() {
+		if err := resultsFile.Close(); err != nil {
+			_ = err
+		}
+	}()
 
-	resultsContent := string(data)
-
-	// Extract TestResult section (simplified parsing)
 	scan := &models.ComplianceScan{
 		ProfileName: profileName,
 		ProfileType: "openscap",
-		Results:     make([]models.ComplianceResult, 0),
 	}
 
-	// Extract rule metadata from the BENCHMARK file (not results file)
-	// The benchmark file (ssg-*-ds.xml) contains Rule definitions with title, description, etc.
-	benchmarkContent := ""
-	if contentFile != "" {
-		if benchmarkData, err := os.ReadFile(contentFile); err == nil {
-			benchmarkContent = string(benchmarkData)
-			s.logger.WithField("content_file", contentFile).Debug("Loaded benchmark file for metadata extraction")
-		} else {
-			s.logger.WithError(err).Warn("Failed to read benchmark file for metadata")
+	// Try results file first (might have embedded benchmark), then fall back to benchmark file
+	s.logger.Info("Starting metadata extraction")
+
+	// Rule metadata depends only on the content file. Once it has been indexed,
+	// skip decoding the benchmark copy embedded in the results and read just
+	// the rule-results
+	cachedMetadata := cachedBenchmarkRuleMetadata(contentFile)
+
+	// Stream the results file once, collecting embedded Rule metadata and rule-results together
+	ruleMetadataMap, ruleResults, err := s.decodeXCCDFResults(resultsFile, cachedMetadata != nil)
+	if err != nil {
+		// Keep whatever was decoded before the error, as the previous regex-based parser did
+		s.logger.WithError(err).Warn("Results file is not well-formed XML, using partially parsed results")
+	}
+	if cachedMetadata != nil {
+		ruleMetadataMap = cachedMetadata
+		s.logger.WithField("rules_from_cache", len(ruleMetadataMap)).Info("Using cached benchmark metadata")
+	} else {
+		s.logger.WithField("rules_from_results", len(ruleMetadataMap)).Info("Extracted metadata from results file")
+		if err == nil && len(ruleMetadataMap) > 0 && contentFile != "" {
+			storeBenchmarkRuleMetadata(contentFile, ruleMetadataMap)
 		}
 	}
 
-	// Try results file first (might have embedded benchmark), then fall back to benchmark file
-	s.logger.WithFields(logutil.SanitizeMap(map[string]interface{}{
-		"results_content_len":   len(resultsContent),
-		"benchmark_content_len": len(benchmarkContent),
-	})).Info("Starting metadata extraction")
-
-	ruleMetadataMap := s.extractRuleMetadata(resultsContent)
-	s.logger.WithField("rules_from_results", len(ruleMetadataMap)).Info("Extracted metadata from results file")
+	// One result per rule-result, at most
+	scan.Results = make([]models.ComplianceResult, 0, len(ruleResults))
 
-	if len(ruleMetadataMap) == 0 && benchmarkContent != "" {
+	if len(ruleMetadataMap) == 0 && contentFile != "" {
 		s.logger.Info("No metadata in results file, extracting from benchmark datastream")
-		ruleMetadataMap = s.extractRuleMetadata(benchmarkContent)
+		ruleMetadataMap = s.benchmarkRuleMetadata(contentFile)
 		s.logger.WithField("rules_from_benchmark", len(ruleMetadataMap)).Info("Extracted metadata from benchmark file")
 	}
 
-	// Parse oscap output for rule-specific failure details
-	// oscap output format: "Title	rule_id	result"
-	// For failures, additional detail lines follow
-	ruleOutputMap := s.parseOscapOutput(oscapOutput)
-
-	// Parse rule results with optional message element
-	// Pattern captures: idref, full rule-result block content
-	ruleResultPattern := regexp.MustCompile(`<rule-result[^>]*idref="([^"]+)"[^>]*>([\s\S]*?)</rule-result>`)
-	resultPattern := regexp.MustCompile(`<result>([^<]+)</result>`)
-	messagePattern := regexp.MustCompile(`<message[^>]*>([^<]+)</message>`)
+	// oscap output holds rule-specific failure details, but it is only needed
+	// for failures without a message, so it is parsed on first use
+	var ruleOutputMap map[string]string
 
-	matches := ruleResultPattern.FindAllStringSubmatch(resultsContent, -1)
+	for _, ruleResult := range ruleResults {
+		ruleID := ruleResult.IDRef
 
-	for _, match := range matches {
-		if len(match) >= 3 {
-			ruleID := match[1]
-			ruleResultContent := match[2]
+		// Extract result status
+		result := strings.TrimSpace(ruleResult.Result)
+		if result == "" {
+			continue
+		}
+		status := s.mapResult(result)
 
-			// Extract result status
-			resultMatch := resultPattern.FindStringSubmatch(ruleResultContent)
-			if len(resultMatch) < 2 {
-				continue
-			}
-			result := strings.TrimSpace(resultMatch[1])
-			status := s.mapResult(result)
-
-			// Extract message if present (contains specific check output for failures)
-			var finding string
-			messageMatch := messagePattern.FindStringSubmatch(ruleResultContent)
-			if len(messageMatch) >= 2 {
-				finding = strings.TrimSpace(messageMatch[1])
-			}
+		// Message, if present, contains specific check output for failures
+		finding := ""
+		if len(ruleResult.Messages) > 0 {
+			finding = strings.TrimSpace(ruleResult.Messages[0])
+		}
 
-			// If no finding from XML, try to get from oscap output
-			if finding == "" && status == "fail" {
-				if outputInfo, ok := ruleOutputMap[ruleID]; ok {
-					finding = outputInfo
-				}
+		// If no finding from XML, try to get from oscap output
+		if finding == "" && status == "fail" {
+			if ruleOutputMap == nil {
+				// oscap output format: "Title	rule_id	result"
+				// For failures, additional detail lines follow
+				ruleOutputMap = s.parseOscapOutput(oscapOutput)
 			}
-
-			// Update counters
-			switch status {
-			case "pass":
-				scan.Passed++
-			case "fail":
-				scan.Failed++
-			case "warn":
-				scan.Warnings++
-			case "skip":
-				scan.Skipped++
-			case "notapplicable":
-				scan.NotApplicable++
+			if outputInfo, ok := ruleOutputMap[ruleID]; ok {
+				finding = outputInfo
 			}
-			scan.TotalRules++
-
-			// Get metadata from embedded benchmark
-			metadata := ruleMetadataMap[ruleID]
+		}
 
-			// Use extracted title or fall back to generated one
-			title := metadata.Title
-			if title == "" {
-				title = s.extractTitle(ruleID)
-			}
+		// Update counters
+		switch status {
+		case "pass":
+			scan.Passed++
+		case "fail":
+			scan.Failed++
+		case "warn":
+			scan.Warnings++
+		case "skip":
+			scan.Skipped++
+		case "notapplicable":
+			scan.NotApplicable++
+		}
+		scan.TotalRules++
+
+		// Get metadata from embedded benchmark
+		metadata := ruleMetadataMap[ruleID]
+
+		// Use extracted title or fall back to generated one
+		title := metadata.Title
+		if title == "" {
+			title = s.extractTitle(ruleID)
+		}
+
+		// Extract actual/expected from finding if possible
+		actual, expected := s.parseActualExpected(finding, metadata.Description)
+
+		scan.Results = append(scan.Results, models.ComplianceResult{
+			RuleID:      ruleID,
+			Title:       title,
+			Status:      status,
+			Finding:     finding,
+			Actual:      actual,
+			Expected:    expected,
+			Description: metadata.Description,
+			Severity:    metadata.Severity,
+			Remediation: metadata.Remediation,
+			Section:     metadata.Section,
+		})
 
-			// Extract actual/expected from finding if possible
-			actual, expected := s.parseActualExpected(finding, metadata.Description)
-
-			scan.Results = append(scan.Results, models.ComplianceResult{
-				RuleID:      ruleID,
-				Title:       title,
-				Status:      status,
-				Finding:     finding,
-				Actual:      actual,
-				Expected:    expected,
-				Description: metadata.Description,
-				Severity:    metadata.Severity,
-				Remediation: metadata.Remediation,
-				Section:     metadata.Section,
-			})
-
-			// Debug logging for result assembly (only for failed rules to reduce noise)
-			if status == "fail" {
-				s.logger.WithFields(logutil.SanitizeMap(map[string]interface{}{
-					"rule_id":         ruleID,
-					"title":           title,
-					"status":          status,
-					"has_description": len(metadata.Description) > 0,
-					"desc_len":        len(metadata.Description),
-					"has_remediation": len(metadata.Remediation) > 0,
-					"severity":        metadata.Severity,
-				})).Debug("Assembled failed rule result")
-			}
+		// Debug logging for result assembly (only for failed rules to reduce noise).
+		// Checked up front so the sanitized field map is not built per rule when unused
+		if status == "fail" && s.logger.IsLevelEnabled(logrus.DebugLevel) {
+			s.logger.WithFields(logutil.SanitizeMap(map[string]interface{}{
+				"rule_id":         ruleID,
+				"title":           title,
+				"status":          status,
+				"has_description": len(metadata.Description) > 0,
+				"desc_len":        len(metadata.Description),
+				"has_remediation": len(metadata.Remediation) > 0,
+				"severity":        metadata.Severity,
+			})).Debug("Assembled failed rule result")
 		}
 	}
 
@@ -1769,12 +2291,13 @@ func (s *OpenSCAPScanner) parseOscapOutput(output string) map[string]string {
 	// oscap output contains lines like:
 	// "Title\trule_id\tresult"
 	// For failed rules, we want to capture any additional context
-	lines := strings.Split(output, "\n")
-
 	var currentRuleID string
 	var currentDetails []string
 
-	for _, line := range lines {
+	rest := output
+	for rest != "" {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
 		line = strings.TrimSpace(line)
 		if line == "" {
 			continue
@@ -1788,8 +2311,7 @@ func (s *OpenSCAPScanner) parseOscapOutput(output string) map[string]string {
 			}
 
 			// Extract rule ID from line
-			rulePattern := regexp.MustCompile(`(xccdf_org\.ssgproject\.content_rule_[^\s\t]+)`)
-			if match := rulePattern.FindStringSubmatch(line); len(match) >= 2 {
+			if match := oscapOutputRulePattern.FindStringSubmatch(line); len(match) >= 2 {
 				currentRuleID = match[1]
 				currentDetails = nil
 
@@ -1831,33 +2353,28 @@ func (s *OpenSCAPScanner) parseActualExpected(finding string, _ string) (actual,
 	// "X is set to Y"
 
 	// Pattern: "expected ... but found ..."
-	pattern1 := regexp.MustCompile(`(?i)expected\s+['"]?([^'"]+?)['"]?\s+but\s+found\s+['"]?([^'"]+?)['"]?`)
-	if match := pattern1.FindStringSubmatch(finding); len(match) >= 3 {
+	if match := expectedButFoundPattern.FindStringSubmatch(finding); len(match) >= 3 {
 		return match[2], match[1] // actual, expected
 	}
 
 	// Pattern: "found ... expected ..."
-	pattern2 := regexp.MustCompile(`(?i)found\s+['"]?([^'"]+?)['"]?\s+expected\s+['"]?([^'"]+?)['"]?`)
-	if match := pattern2.FindStringSubmatch(finding); len(match) >= 3 {
+	if match := foundExpectedPattern.FindStringSubmatch(finding); len(match) >= 3 {
 		return match[1], match[2]
 	}
 
 	// Pattern: "is set to X" (actual value)
-	pattern3 := regexp.MustCompile(`(?i)is\s+set\s+to\s+['"]?([^'"]+?)['"]?`)
-	if match := pattern3.FindStringSubmatch(finding); len(match) >= 2 {
+	if match := isSetToPattern.FindStringSubmatch(finding); len(match) >= 2 {
 		actual = match[1]
 	}
 
 	// Pattern: "should be X" (expected value)
-	pattern4 := regexp.MustCompile(`(?i)should\s+be\s+['"]?([^'"]+?)['"]?`)
-	if match := pattern4.FindStringSubmatch(finding); len(match) >= 2 {
+	if match := shouldBePattern.FindStringSubmatch(finding); len(match) >= 2 {
 		expected = match[1]
 	}
 
 	// Pattern: "value X" or "= X"
-	pattern5 := regexp.MustCompile(`(?:value|=)\s*['"]?(\S+)['"]?`)
 	if actual == "" {
-		if match := pattern5.FindStringSubmatch(finding); len(match) >= 2 {
+		if match := valuePattern.FindStringSubmatch(finding); len(match) >= 2 {
 			actual = match[1]
 		}
 	}
@@ -1865,166 +2382,27 @@ func (s *OpenSCAPScanner) parseActualExpected(finding string, _ string) (actual,
 	return actual, expected
 }
 
-// extractRuleMetadata extracts rule definitions from the embedded benchmark in XCCDF results
-func (s *OpenSCAPScanner) extractRuleMetadata(content string) map[string]ruleMetadata {
-	metadata := make(map[string]ruleMetadata)
-
-	// Extract Rule elements using a more robust approach:
-	// 1. Find all Rule opening tags and their positions
-	// 2. Find the corresponding closing tag (handling nesting)
-	// 3. Extract attributes and content separately
-
-	// Pattern to match Rule opening tags with any attributes
-	// Namespace prefix can be like "xccdf-1.2:" so we need to include dots and hyphens
-	ruleOpenPattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?Rule\s+([^>]*)>`)
-	idPattern := regexp.MustCompile(`id="([^"]+)"`)
-	severityAttrPattern := regexp.MustCompile(`severity="([^"]*)"`)
-
-	// Patterns for child elements (handle any namespace prefix including dots like xccdf-1.2:)
-	titlePattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?title[^>]*>([^<]+)</([a-zA-Z0-9._-]*:)?title>`)
-	descPattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?description[^>]*>([\s\S]*?)</([a-zA-Z0-9._-]*:)?description>`)
-	rationalePattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?rationale[^>]*>([\s\S]*?)</([a-zA-Z0-9._-]*:)?rationale>`)
-	// For fix elements, prefer shell script remediation (system="urn:xccdf:fix:script:sh")
-	fixShPattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?fix[^>]*system="urn:xccdf:fix:script:sh"[^>]*>([\s\S]*?)</([a-zA-Z0-9._-]*:)?fix>`)
-	fixPattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?fix[^>]*>([\s\S]*?)</([a-zA-Z0-9._-]*:)?fix>`)
-	fixTextPattern := regexp.MustCompile(`<([a-zA-Z0-9._-]*:)?fixtext[^>]*>([\s\S]*?)</([a-zA-Z0-9._-]*:)?fixtext>`)
-
-	// Find all Rule opening tags
-	openMatches := ruleOpenPattern.FindAllStringSubmatchIndex(content, -1)
-
-	for _, openMatch := range openMatches {
-		if len(openMatch) < 6 {
-			continue
-		}
-
-		tagStart := openMatch[0]
-		tagEnd := openMatch[1]
-		nsPrefix := ""
-		if openMatch[2] >= 0 && openMatch[3] > openMatch[2] {
-			nsPrefix = content[openMatch[2]:openMatch[3]]
-		}
-		attributes := content[openMatch[4]:openMatch[5]]
-
-		// Extract id from attributes
-		idMatch := idPattern.FindStringSubmatch(attributes)
-		if len(idMatch) < 2 {
-			continue
-		}
-		ruleID := idMatch[1]
-
-		// Find the closing tag for this Rule element
-		// Build the closing tag pattern based on namespace prefix
-		closingTag := "</" + nsPrefix + "Rule>"
-		openingTag := "<" + nsPrefix + "Rule"
-
-		// Find closing tag, accounting for potential nested Rule elements
-		ruleContent := ""
-		depth := 1
-		searchStart := tagEnd
-		for depth > 0 && searchStart < len(content) {
-			nextOpen := strings.Index(content[searchStart:], openingTag)
-			nextClose := strings.Index(content[searchStart:], closingTag)
-
-			if nextClose == -1 {
-				// No closing tag found
-				break
-			}
-
-			if nextOpen != -1 && nextOpen < nextClose {
-				// Found another opening tag before closing
-				depth++
-				searchStart = searchStart + nextOpen + len(openingTag)
-			} else {
-				// Found closing tag
-				depth--
-				if depth == 0 {
-					ruleContent = content[tagEnd : searchStart+nextClose]
-				}
-				searchStart = searchStart + nextClose + len(closingTag)
-			}
-		}
-
-		// If nesting approach failed, try simpler non-greedy match
-		if ruleContent == "" {
-			// Look for closing tag within reasonable distance (500KB limit per rule)
-			endIdx := tagStart + 500000
-			if endIdx > len(content) {
-				endIdx = len(content)
-			}
-			searchContent := content[tagEnd:endIdx]
-			closeIdx := strings.Index(searchContent, closingTag)
-			if closeIdx != -1 {
-				ruleContent = searchContent[:closeIdx]
-			}
-		}
-
-		if ruleContent == "" {
-			s.logger.WithField("rule_id", ruleID).Debug("Could not find Rule content")
-			continue
-		}
-
-		meta := ruleMetadata{}
-
-		// Extract severity from attributes
-		if sevMatch := severityAttrPattern.FindStringSubmatch(attributes); len(sevMatch) >= 2 {
-			meta.Severity = sevMatch[1]
-		}
-
-		// Extract title - use the inner text (group 2)
-		if titleMatch := titlePattern.FindStringSubmatch(ruleContent); len(titleMatch) >= 3 {
-			meta.Title = s.cleanXMLText(titleMatch[2])
-		}
-
-		// Extract description - use the inner text (group 2)
-		if descMatch := descPattern.FindStringSubmatch(ruleContent); len(descMatch) >= 3 {
-			meta.Description = s.cleanXMLText(descMatch[2])
-		}
-
-		// Extract rationale (append to description if present)
-		if ratMatch := rationalePattern.FindStringSubmatch(ruleContent); len(ratMatch) >= 3 {
-			rationale := s.cleanXMLText(ratMatch[2])
-			if rationale != "" {
-				if meta.Description != "" {
-					meta.Description = meta.Description + "\n\nRationale: " + rationale
-				} else {
-					meta.Description = "Rationale: " + rationale
-				}
-			}
-		}
-
-		// Extract fix/remediation - prefer shell script fix, then any fix, then fixtext
-		if fixShMatch := fixShPattern.FindStringSubmatch(ruleContent); len(fixShMatch) >= 3 {
-			meta.Remediation = s.cleanXMLText(fixShMatch[2])
-		}
-		if meta.Remediation == "" {
-			if fixMatch := fixPattern.FindStringSubmatch(ruleContent); len(fixMatch) >= 3 {
-				meta.Remediation = s.cleanXMLText(fixMatch[2])
-			}
-		}
-		if meta.Remediation == "" {
-			if fixTextMatch := fixTextPattern.FindStringSubmatch(ruleContent); len(fixTextMatch) >= 3 {
-				meta.Remediation = s.cleanXMLText(fixTextMatch[2])
-			}
-		}
-
-		// Extract section from rule ID (e.g., "1.1.1" from rule naming)
-		meta.Section = s.extractSection(ruleID)
-
-		metadata[ruleID] = meta
-
-		// Debug logging for metadata extraction verification
-		s.logger.WithFields(logutil.SanitizeMap(map[string]interface{}{
-			"rule_id":         ruleID,
-			"title":           meta.Title,
-			"title_len":       len(meta.Title),
-			"desc_len":        len(meta.Description),
-			"desc_preview":    truncateString(meta.Description, 100),
-			"remediation_len": len(meta.Remediation),
-			"severity":        meta.Severity,
-			"section":         meta.Section,
-		})).Debug("Extracted rule metadata")
+// logRuleMetadata logs extracted metadata for a single rule at debug level
+func (s *OpenSCAPScanner) logRuleMetadata(ruleID string, meta ruleMetadata) {
+	// Called once per rule; skip building the sanitized field map when debug is off
+	if !s.logger.IsLevelEnabled(logrus.DebugLevel) {
+		return
 	}
+	// Debug logging for metadata extraction verification
+	s.logger.WithFields(logutil.SanitizeMap(map[string]interface{}{
+		"rule_id":         ruleID,
+		"title":           meta.Title,
+		"title_len":       len(meta.Title),
+		"desc_len":        len(meta.Description),
+		"desc_preview":    truncateString(meta.Description, 100),
+		"remediation_len": len(meta.Remediation),
+		"severity":        meta.Severity,
+		"section":         meta.Section,
+	})).Debug("Extracted rule metadata")
+}
 
+// logRuleMetadataSummary logs how many extracted rules carry each kind of metadata
+func (s *OpenSCAPScanner) logRuleMetadataSummary(metadata map[string]ruleMetadata) {
 	// Count rules with actual content for debugging
 	withTitle := 0
 	withDesc := 0
@@ -2047,15 +2425,12 @@ func (s *OpenSCAPScanner) extractRuleMetadata(content string) map[string]ruleMet
 		"with_description": withDesc,
 		"with_remediation": withRemediation,
 	})).Info("Extracted rule metadata summary")
-
-	return metadata
 }
 
 // cleanXMLText removes HTML/XML tags and cleans up whitespace
 func (s *OpenSCAPScanner) cleanXMLText(text string) string {
 	// Remove HTML tags
-	htmlPattern := regexp.MustCompile(`<[^>]+>`)
-	text = htmlPattern.ReplaceAllString(text, " ")
+	text = xmlTagPattern.ReplaceAllString(text, " ")
 
 	// Decode common HTML entities
 	text = strings.ReplaceAll(text, "&lt;", "<")
@@ -2066,8 +2441,7 @@ func (s *OpenSCAPScanner) cleanXMLText(text string) string {
 	text = strings.ReplaceAll(text, "&#10;", "\n")
 
 	// Clean up whitespace
-	whitespacePattern := regexp.MustCompile(`\s+`)
-	text = whitespacePattern.ReplaceAllString(text, " ")
+	text = whitespaceRunPattern.ReplaceAllString(text, " ")
 
 	return strings.TrimSpace(text)
 }
@@ -2083,8 +2457,7 @@ func truncateString(s string, maxLen int) string {
 // extractSection attempts to extract a section number from the rule ID
 func (s *OpenSCAPScanner) extractSection(ruleID string) string {
 	// Look for patterns like "1_1_1" or "1.1.1" in the rule ID
-	sectionPattern := regexp.MustCompile(`(\d+[_\.]\d+(?:[_\.]\d+)*)`)
-	if match := sectionPattern.FindString(ruleID); match != "" {
+	if match := ruleSectionPattern.FindString(ruleID); match != "" {
 		// Convert underscores to dots for display
 		return strings.ReplaceAll(match, "_", ".")
 	}
@@ -0,0 +1,486 @@
+package compliance
+
+import (
+	"context"
+	"io"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"patchmon-agent/pkg/models"
+
+	"github.com/sirupsen/logrus"
+)
+
+func newTestOpenSCAPScanner() *OpenSCAPScanner {
+	log := logrus.New()
+	log.SetOutput(io.Discard)
+	return &OpenSCAPScanner{logger: log}
+}
+
+// Trimmed-down `oscap xccdf eval --results` output: the benchmark is embedded
+// ahead of the TestResult, as oscap writes it.
+const sampleXCCDFResults = `<?xml version="1.0" encoding="UTF-8"?>
+<Benchmark xmlns="http://checklists.nist.gov/xccdf/1.2" xmlns:h="http://www.w3.org/1999/xhtml" id="xccdf_org.ssgproject.content_benchmark_UBUNTU2204">
+  <title>CIS Ubuntu 22.04</title>
+  <Group id="xccdf_org.ssgproject.content_group_system">
+    <title>System Settings</title>
+    <Rule id="xccdf_org.ssgproject.content_rule_partition_for_tmp" selected="true" severity="low">
+      <title>Ensure /tmp Located On Separate Partition</title>
+      <description>The <h:code>/tmp</h:code> directory is a world-writable directory.</description>
+      <rationale>Placing <h:code>/tmp</h:code> in its own partition enables &lt;noexec&gt;.</rationale>
+      <fix system="urn:xccdf:fix:script:ansible">- name: ansible fix</fix>
+      <fix system="urn:xccdf:fix:script:sh">mount -o remount /tmp</fix>
+    </Rule>
+    <Rule id="xccdf_org.ssgproject.content_rule_sshd_disable_root_login" selected="true" severity="medium">
+      <title>Disable SSH Root Login</title>
+      <description>The root user should never be allowed to login directly.</description>
+      <fixtext>Set PermitRootLogin no in sshd_config.</fixtext>
+    </Rule>
+  </Group>
+  <TestResult id="xccdf_org.open-scap_testresult_cis">
+    <rule-result idref="xccdf_org.ssgproject.content_rule_partition_for_tmp" severity="low" time="2024-01-01T00:00:00+00:00" weight="1.000000">
+      <result>fail</result>
+      <message severity="info">/tmp is not a separate mount point</message>
+      <ident system="https://ncp.nist.gov/cce">CCE-82069-8</ident>
+      <check system="http://oval.mitre.org/XMLSchema/oval-definitions-5">
+        <check-content-ref name="oval:ssg-partition_for_tmp:def:1" href="#oval0"/>
+      </check>
+    </rule-result>
+    <rule-result idref="xccdf_org.ssgproject.content_rule_sshd_disable_root_login" severity="medium">
+      <result>pass</result>
+    </rule-result>
+    <rule-result idref="xccdf_org.ssgproject.content_rule_package_telnet_removed">
+      <result>notapplicable</result>
+    </rule-result>
+  </TestResult>
+</Benchmark>
+`
+
+func TestOpenSCAPParseResults(t *testing.T) {
+	resultsPath := filepath.Join(t.TempDir(), "results.xml")
+	if err := os.WriteFile(resultsPath, []byte(sampleXCCDFResults), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	s := newTestOpenSCAPScanner()
+	scan, err := s.parseResults(resultsPath, "", "level1_server", "")
+	if err != nil {
+		t.Fatalf("parseResults: %v", err)
+	}
+
+	if scan.TotalRules != 3 || scan.Passed != 1 || scan.Failed != 1 || scan.NotApplicable != 1 {
+		t.Fatalf("counts = total %d pass %d fail %d na %d, want 3/1/1/1",
+			scan.TotalRules, scan.Passed, scan.Failed, scan.NotApplicable)
+	}
+	// 1 pass out of 2 applicable
+	if scan.Score != 50 {
+		t.Errorf("Score = %v, want 50", scan.Score)
+	}
+
+	tmp := scan.Results[0]
+	if tmp.RuleID != "xccdf_org.ssgproject.content_rule_partition_for_tmp" || tmp.Status != "fail" {
+		t.Errorf("result 0 = {%q %q}", tmp.RuleID, tmp.Status)
+	}
+	if tmp.Title != "Ensure /tmp Located On Separate Partition" {
+		t.Errorf("title = %q", tmp.Title)
+	}
+	if tmp.Severity != "low" {
+		t.Errorf("severity = %q, want low", tmp.Severity)
+	}
+	if tmp.Finding != "/tmp is not a separate mount point" {
+		t.Errorf("finding = %q", tmp.Finding)
+	}
+	wantDesc := "The /tmp directory is a world-writable directory.\n\nRationale: Placing /tmp in its own partition enables <noexec>."
+	if tmp.Description != wantDesc {
+		t.Errorf("description = %q, want %q", tmp.Description, wantDesc)
+	}
+	if tmp.Remediation != "mount -o remount /tmp" {
+		t.Errorf("remediation = %q, want the shell fix", tmp.Remediation)
+	}
+
+	ssh := scan.Results[1]
+	if ssh.Status != "pass" || ssh.Remediation != "Set PermitRootLogin no in sshd_config." {
+		t.Errorf("result 1 = {%q %q}", ssh.Status, ssh.Remediation)
+	}
+
+	// No Rule definition: title falls back to one generated from the rule ID
+	telnet := scan.Results[2]
+	if telnet.Status != "notapplicable" || telnet.Title != "Package telnet removed" {
+		t.Errorf("result 2 = {%q %q}", telnet.Status, telnet.Title)
+	}
+}
+
+func TestOpenSCAPExtractSection(t *testing.T) {
+	tests := []struct {
+		ruleID string
+		want   string
+	}{
+		{"xccdf_org.ssgproject.content_rule_1_1_1_disable_cramfs", "1.1.1"},
+		{"xccdf_org.ssgproject.content_rule_5.2.10_sshd", "5.2.10"},
+		{"xccdf_org.ssgproject.content_rule_sshd_disable_root_login", ""},
+	}
+
+	s := newTestOpenSCAPScanner()
+	for _, tt := range tests {
+		if got := s.extractSection(tt.ruleID); got != tt.want {
+			t.Errorf("extractSection(%q) = %q, want %q", tt.ruleID, got, tt.want)
+		}
+	}
+}
+
+func TestParseOSRelease(t *testing.T) {
+	tests := []struct {
+		name       string
+		content    string
+		wantName   string
+		wantVer    string
+		wantFamily string
+		wantIDLike string
+	}{
+		{
+			name:       "alma from ID_LIKE",
+			content:    "NAME=\"AlmaLinux\"\nID=\"almalinux\"\nVERSION_ID=\"9.3\"\nID_LIKE=\"rhel centos fedora\"\n",
+			wantName:   "almalinux",
+			wantVer:    "9.3",
+			wantFamily: "rhel",
+			wantIDLike: "rhel centos fedora",
+		},
+		{
+			name:       "debian from ID",
+			content:    "PRETTY_NAME=\"Debian GNU/Linux 12 (bookworm)\"\nID=debian\nVERSION_ID=\"12\"\n\n# comment\n",
+			wantName:   "debian",
+			wantVer:    "12",
+			wantFamily: "debian",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			path := filepath.Join(t.TempDir(), "os-release")
+			if err := os.WriteFile(path, []byte(tt.content), 0o600); err != nil {
+				t.Fatal(err)
+			}
+			info, idLike, err := parseOSRelease(path)
+			if err != nil {
+				t.Fatalf("parseOSRelease: %v", err)
+			}
+			if info.Name != tt.wantName || info.Version != tt.wantVer || info.Family != tt.wantFamily {
+				t.Errorf("info = %+v, want {%s %s %s}", info, tt.wantName, tt.wantVer, tt.wantFamily)
+			}
+			if idLike != tt.wantIDLike {
+				t.Errorf("idLike = %q, want %q", idLike, tt.wantIDLike)
+			}
+		})
+	}
+}
+
+func TestReadOSReleaseRetriesAfterError(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "os-release")
+	origPath := osReleasePath
+	osReleasePath = path
+	resetOSRelease := func() {
+		osRelease.Lock()
+		osRelease.ok = false
+		osRelease.Unlock()
+	}
+	resetOSRelease()
+	t.Cleanup(func() {
+		osReleasePath = origPath
+		resetOSRelease()
+	})
+
+	if _, _, err := readOSRelease(); err == nil {
+		t.Fatal("readOSRelease succeeded without an os-release file")
+	}
+
+	// The failed read must not stick
+	if err := os.WriteFile(path, []byte("ID=ubuntu\nVERSION_ID=\"22.04\"\nID_LIKE=debian\n"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	info, idLike, err := readOSRelease()
+	if err != nil || info.Name != "ubuntu" || idLike != "debian" {
+		t.Fatalf("readOSRelease() = %+v, %q, %v after the file appeared", info, idLike, err)
+	}
+
+	// A successful read is cached
+	if err := os.Remove(path); err != nil {
+		t.Fatal(err)
+	}
+	if info, _, err := readOSRelease(); err != nil || info.Version != "22.04" {
+		t.Errorf("readOSRelease() = %+v, %v, want the cached result", info, err)
+	}
+}
+
+func TestOpenSCAPGetContentOSName(t *testing.T) {
+	tests := []struct {
+		id, idLike string
+		want       string
+	}{
+		{"almalinux", "rhel centos fedora", "almalinux"},
+		{"alma", "rhel", "alma"},
+		{"linuxmint", "ubuntu debian", "ubuntu"},
+		{"pop", "", "pop"},
+	}
+
+	for _, tt := range tests {
+		s := newTestOpenSCAPScanner()
+		s.osInfo.Name = tt.id
+		s.idLike = tt.idLike
+		if got := s.getContentOSName(); got != tt.want {
+			t.Errorf("getContentOSName(%q, %q) = %q, want %q", tt.id, tt.idLike, got, tt.want)
+		}
+	}
+}
+
+// Trimmed-down SCAP datastream: the XCCDF benchmark sits inside a component
+// and uses a namespace prefix, as in the ssg-*-ds.xml files.
+const sampleDatastream = `<?xml version="1.0" encoding="UTF-8"?>
+<ds:data-stream-collection xmlns:ds="http://scap.nist.gov/schema/scap/source/1.2" xmlns:xccdf-1.2="http://checklists.nist.gov/xccdf/1.2">
+  <ds:component id="scap_org.open-scap_comp_ssg-ubuntu2204-xccdf.xml">
+    <xccdf-1.2:Benchmark id="xccdf_org.ssgproject.content_benchmark_UBUNTU2204">
+      <xccdf-1.2:title>Guide to the Secure Configuration of Ubuntu 22.04</xccdf-1.2:title>
+      <xccdf-1.2:Group id="xccdf_org.ssgproject.content_group_services">
+        <xccdf-1.2:title>Services</xccdf-1.2:title>
+        <xccdf-1.2:Rule id="xccdf_org.ssgproject.content_rule_package_telnet_removed" severity="high">
+          <xccdf-1.2:title>Uninstall telnet Package</xccdf-1.2:title>
+          <xccdf-1.2:description>The telnet client transmits credentials in clear text.</xccdf-1.2:description>
+          <xccdf-1.2:fix system="urn:xccdf:fix:script:sh">apt-get remove -y telnet</xccdf-1.2:fix>
+        </xccdf-1.2:Rule>
+      </xccdf-1.2:Group>
+    </xccdf-1.2:Benchmark>
+  </ds:component>
+</ds:data-stream-collection>
+`
+
+func TestOpenSCAPBenchmarkRuleMetadata(t *testing.T) {
+	contentFile := filepath.Join(t.TempDir(), "ssg-ubuntu2204-ds.xml")
+	if err := os.WriteFile(contentFile, []byte(sampleDatastream), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	s := newTestOpenSCAPScanner()
+	rules := s.benchmarkRuleMetadata(contentFile)
+	if len(rules) != 1 {
+		t.Fatalf("got %d rules, want 1", len(rules))
+	}
+	meta := rules["xccdf_org.ssgproject.content_rule_package_telnet_removed"]
+	if meta.Title != "Uninstall telnet Package" || meta.Severity != "high" {
+		t.Errorf("meta = {%q %q}", meta.Title, meta.Severity)
+	}
+	if meta.Remediation != "apt-get remove -y telnet" {
+		t.Errorf("remediation = %q", meta.Remediation)
+	}
+}
+
+func TestOpenSCAPFindContentFile(t *testing.T) {
+	names := []string{"ssg-debian11-ds.xml", "ssg-debian12-ds.xml", "ssg-rhel9-ds.xml", "ssg-ubuntu2204-ds.xml"}
+	tests := []struct {
+		osName, version string
+		want            string
+	}{
+		{"ubuntu", "22.04", "ssg-ubuntu2204-ds.xml"},
+		{"rhel", "9.3", "ssg-rhel9-ds.xml"},
+		// No debian13 content yet: fall back to the newest older release
+		{"debian", "13", "ssg-debian12-ds.xml"},
+		{"sles", "15", ""},
+	}
+
+	for _, tt := range tests {
+		s := newTestOpenSCAPScanner()
+		s.osInfo.Version = tt.version
+		want := ""
+		if tt.want != "" {
+			want = filepath.Join(scapContentDir, tt.want)
+		}
+		if got := s.findContentFile(names, tt.osName); got != want {
+			t.Errorf("findContentFile(%q %q) = %q, want %q", tt.osName, tt.version, got, want)
+		}
+	}
+}
+
+func TestParseProfileList(t *testing.T) {
+	output := "xccdf_org.ssgproject.content_profile_cis_level1_server:CIS Ubuntu 22.04 Level 1 Server Benchmark\n" +
+		"\n" +
+		"xccdf_org.ssgproject.content_profile_standard:Standard System Security Profile for Ubuntu 22.04\n" +
+		"xccdf_org.ssgproject.content_profile_unnamed\n"
+
+	got := parseProfileList(output)
+	want := []contentProfile{
+		{"xccdf_org.ssgproject.content_profile_cis_level1_server", "CIS Ubuntu 22.04 Level 1 Server Benchmark"},
+		{"xccdf_org.ssgproject.content_profile_standard", "Standard System Security Profile for Ubuntu 22.04"},
+		{"xccdf_org.ssgproject.content_profile_unnamed", ""},
+	}
+	if len(got) != len(want) {
+		t.Fatalf("got %d profiles, want %d: %+v", len(got), len(want), got)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Errorf("profile %d = %+v, want %+v", i, got[i], want[i])
+		}
+	}
+}
+
+func TestOpenSCAPParseResultsReusesContentMetadata(t *testing.T) {
+	dir := t.TempDir()
+	// The content file is only stat'ed while its cached index is current
+	contentFile := filepath.Join(dir, "ssg-test-ds.xml")
+	if err := os.WriteFile(contentFile, []byte("<data-stream-collection/>"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	resultsPath := filepath.Join(dir, "results.xml")
+	if err := os.WriteFile(resultsPath, []byte(sampleXCCDFResults), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	s := newTestOpenSCAPScanner()
+	if _, err := s.parseResults(resultsPath, contentFile, "level1_server", ""); err != nil {
+		t.Fatalf("first parseResults: %v", err)
+	}
+	if cachedBenchmarkRuleMetadata(contentFile) == nil {
+		t.Fatal("rule metadata from the results file was not cached for the content file")
+	}
+
+	// A second scan against the same content takes metadata from the cache,
+	// so titles survive even without Rule definitions in the results
+	bare := `<TestResult xmlns="http://checklists.nist.gov/xccdf/1.2">
+  <rule-result idref="xccdf_org.ssgproject.content_rule_sshd_disable_root_login"><result>fail</result></rule-result>
+</TestResult>`
+	if err := os.WriteFile(resultsPath, []byte(bare), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	scan, err := s.parseResults(resultsPath, contentFile, "level1_server", "")
+	if err != nil {
+		t.Fatalf("second parseResults: %v", err)
+	}
+	if len(scan.Results) != 1 || scan.Results[0].Title != "Disable SSH Root Login" {
+		t.Errorf("results = %+v, want the cached title", scan.Results)
+	}
+}
+
+func TestCachedScanResult(t *testing.T) {
+	dir := t.TempDir()
+	contentFile := filepath.Join(dir, "ssg-test-ds.xml")
+	packagesDB := filepath.Join(dir, "status")
+	for _, path := range []string{contentFile, packagesDB} {
+		if err := os.WriteFile(path, []byte("x"), 0o600); err != nil {
+			t.Fatal(err)
+		}
+	}
+	orig := packageDatabases
+	packageDatabases = []string{filepath.Join(dir, "missing"), packagesDB}
+	t.Cleanup(func() { packageDatabases = orig })
+
+	key, ok := newScanResultKey(contentFile, "level1_server")
+	if !ok {
+		t.Fatal("newScanResultKey reported the inputs unreadable")
+	}
+	storeScanResult(key, &models.ComplianceScan{ProfileName: "level1_server", Passed: 3})
+
+	if scan := cachedScanResult(key, time.Hour); scan == nil || scan.Passed != 3 {
+		t.Fatalf("cachedScanResult = %+v, want the stored scan", scan)
+	}
+	if scan := cachedScanResult(key, 0); scan != nil {
+		t.Error("expired result was reused")
+	}
+	other, _ := newScanResultKey(contentFile, "level2_server")
+	if scan := cachedScanResult(other, time.Hour); scan != nil {
+		t.Error("result was reused for a different profile")
+	}
+
+	// Installing or removing packages rewrites the package database
+	later := time.Now().Add(time.Minute)
+	if err := os.Chtimes(packagesDB, later, later); err != nil {
+		t.Fatal(err)
+	}
+	changed, _ := newScanResultKey(contentFile, "level1_server")
+	if scan := cachedScanResult(changed, time.Hour); scan != nil {
+		t.Error("result was reused after the installed packages changed")
+	}
+
+	packageDatabases = []string{filepath.Join(dir, "missing")}
+	if _, ok := newScanResultKey(contentFile, "level1_server"); ok {
+		t.Error("newScanResultKey accepted a host without a package database")
+	}
+}
+
+// TestCachedScanResultIsACopy checks that a reused scan shares nothing with
+// the cache and keeps the timestamps of the run that produced it.
+func TestCachedScanResultIsACopy(t *testing.T) {
+	key := scanResultKey{contentPath: "ssg-test-ds.xml", profile: "level1_server", packagesModTime: time.Unix(1, 0)}
+	startedAt := time.Date(2026, 1, 2, 3, 4, 5, 0, time.UTC)
+	completedAt := startedAt.Add(5 * time.Minute)
+	scan := &models.ComplianceScan{
+		ProfileName: "level1_server",
+		Status:      "completed",
+		StartedAt:   startedAt,
+		CompletedAt: &completedAt,
+		Results:     []models.ComplianceResult{{RuleID: "sshd_disable_root_login", Status: "fail"}},
+	}
+	storeScanResult(key, scan)
+
+	// Changing the stored scan or a handed-out copy must not reach the cache
+	scan.Results[0].Status = "pass"
+	reused := cachedScanResult(key, time.Hour)
+	if reused == nil {
+		t.Fatal("cachedScanResult returned nothing for the stored key")
+	}
+	reused.Results[0].Status = "error"
+
+	again := cachedScanResult(key, time.Hour)
+	if again.Results[0].Status != "fail" {
+		t.Errorf("cached result status = %q, want the stored %q", again.Results[0].Status, "fail")
+	}
+	if !again.StartedAt.Equal(startedAt) || again.CompletedAt == nil || !again.CompletedAt.Equal(completedAt) {
+		t.Errorf("reused scan times = %v / %v, want the original run's %v / %v", again.StartedAt, again.CompletedAt, startedAt, completedAt)
+	}
+}
+
+// TestRunOpenSCAPScanReusesScheduledResult drives the integration: only a
+// scheduled scan (nil options) with a reuse window takes the stored result.
+func TestRunOpenSCAPScanReusesScheduledResult(t *testing.T) {
+	dir := t.TempDir()
+	contentFile := filepath.Join(dir, "ssg-ubuntu2204-ds.xml")
+	packagesDB := filepath.Join(dir, "status")
+	for _, path := range []string{contentFile, packagesDB} {
+		if err := os.WriteFile(path, []byte("x"), 0o600); err != nil {
+			t.Fatal(err)
+		}
+	}
+	origDir, origDBs := scapContentDir, packageDatabases
+	scapContentDir = dir
+	packageDatabases = []string{packagesDB}
+	t.Cleanup(func() { scapContentDir, packageDatabases = origDir, origDBs })
+
+	s := newTestOpenSCAPScanner()
+	s.available = true
+	s.osInfo = models.ComplianceOSInfo{Family: "debian", Name: "ubuntu", Version: "22.04"}
+
+	key, ok := newScanResultKey(contentFile, "level1_server")
+	if !ok {
+		t.Fatal("newScanResultKey reported the inputs unreadable")
+	}
+	storeScanResult(key, &models.ComplianceScan{ProfileName: "level1_server", ProfileType: "openscap", Status: "completed", Passed: 7})
+
+	c := &Integration{logger: s.logger, openscap: s, resultReuseWindow: time.Hour}
+	ctx := context.Background()
+
+	if scan := c.runOpenSCAPScan(ctx, nil, "", time.Now()); scan.Status != "completed" || scan.Passed != 7 {
+		t.Fatalf("scheduled scan = %+v, want the stored result", scan)
+	}
+
+	// Anything else runs oscap, which cannot succeed against fixture content
+	scan := c.runOpenSCAPScan(ctx, &models.ComplianceScanOptions{ProfileID: "level1_server"}, "level1_server", time.Now())
+	if scan.Status != "failed" {
+		t.Errorf("on-demand scan = %+v, want a fresh (failed) run", scan)
+	}
+	// Failed scans are stamped in UTC like completed ones
+	if scan.StartedAt.Location() != time.UTC || scan.CompletedAt == nil || scan.CompletedAt.Location() != time.UTC {
+		t.Errorf("failed scan times = %v / %v, want both set in UTC", scan.StartedAt, scan.CompletedAt)
+	}
+	c.resultReuseWindow = 0
+	if scan := c.runOpenSCAPScan(ctx, nil, "", time.Now()); scan.Status != "failed" {
+		t.Errorf("scheduled scan without a reuse window = %+v, want a fresh (failed) run", scan)
+	}
+}
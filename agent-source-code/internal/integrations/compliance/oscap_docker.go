@@ -6,7 +6,9 @@ import (
 	"fmt"
 	"os/exec"
 	"regexp"
+	"runtime"
 	"strings"
+	"sync"
 	"time"
 
 	"patchmon-agent/internal/logutil"
@@ -17,8 +19,37 @@ import (
 
 const (
 	oscapDockerBinary = "oscap-docker"
+
+	// oscapDockerMaxParallel caps concurrent image scans in ScanAllImages
+	oscapDockerMaxParallel = 4
+)
+
+var (
+	// CVE identifiers in oscap-docker output
+	oscapDockerCVEPattern = regexp.MustCompile(`(CVE-\d{4}-\d+)`)
+	// Severity words in oscap-docker output; keys of cveSeverities
+	oscapDockerSeverityPattern = regexp.MustCompile(`(?i)(critical|high|important|medium|moderate|low)`)
 )
 
+// cveSeverities normalizes the severity words oscap-docker prints
+var cveSeverities = map[string]string{
+	"critical":  "critical",
+	"high":      "high",
+	"important": "high",
+	"medium":    "medium",
+	"moderate":  "medium",
+	"low":       "low",
+}
+
+// cveSeverityPenalties is the score penalty per CVE of each severity:
+// critical = 10, high = 5, medium = 2, low = 1
+var cveSeverityPenalties = map[string]int{
+	"critical": 10,
+	"high":     5,
+	"medium":   2,
+	"low":      1,
+}
+
 // OscapDockerScanner handles Docker image/container vulnerability scanning using oscap-docker
 type OscapDockerScanner struct {
 	logger    *logrus.Logger
@@ -108,10 +139,7 @@ func (s *OscapDockerScanner) ScanImage(ctx context.Context, imageName string) (*
 
 	// Parse the output
 	scan := s.parseImageCveOutput(string(output), imageName)
-	scan.StartedAt = startTime
-	now := time.Now()
-	scan.CompletedAt = &now
-	scan.Status = "completed"
+	markCompleted(scan, startTime)
 
 	s.logger.WithFields(logrus.Fields{
 		"image":           imageName,
@@ -152,10 +180,7 @@ func (s *OscapDockerScanner) ScanContainer(ctx context.Context, containerName st
 
 	// Parse the output
 	scan := s.parseContainerCveOutput(string(output), containerName)
-	scan.StartedAt = startTime
-	now := time.Now()
-	scan.CompletedAt = &now
-	scan.Status = "completed"
+	markCompleted(scan, startTime)
 
 	s.logger.WithFields(logrus.Fields{
 		"container":       containerName,
@@ -179,7 +204,7 @@ func (s *OscapDockerScanner) ScanAllImages(ctx context.Context) ([]*models.Compl
 		return nil, fmt.Errorf("failed to list Docker images: %w", err)
 	}
 
-	var scans []*models.ComplianceScan
+	var images []string
 	scanner := bufio.NewScanner(strings.NewReader(string(output)))
 
 	for scanner.Scan() {
@@ -187,13 +212,37 @@ func (s *OscapDockerScanner) ScanAllImages(ctx context.Context) ([]*models.Compl
 		if imageName == "" || imageName == "<none>:<none>" {
 			continue
 		}
+		images = append(images, imageName)
+	}
 
-		scan, err := s.ScanImage(ctx, imageName)
-		if err != nil {
-			s.logger.WithError(err).WithField("image", imageName).Warn("Failed to scan image, skipping")
-			continue
+	// Each image is a separate, largely single-threaded oscap process, so scan
+	// several at once; the cap keeps oscap's memory use in check
+	results := make([]*models.ComplianceScan, len(images))
+	sem := make(chan struct{}, min(runtime.NumCPU(), oscapDockerMaxParallel))
+	var wg sync.WaitGroup
+	for i, imageName := range images {
+		wg.Add(1)
+		go func(i int, imageName string) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			scan, err := s.ScanImage(ctx, imageName)
+			if err != nil {
+				s.logger.WithError(err).WithField("image", imageName).Warn("Failed to scan image, skipping")
+				return
+			}
+			results[i] = scan
+		}(i, imageName)
+	}
+	wg.Wait()
+
+	// Keep the docker images order, dropping images that failed to scan
+	scans := make([]*models.ComplianceScan, 0, len(results))
+	for _, scan := range results {
+		if scan != nil {
+			scans = append(scans, scan)
 		}
-		scans = append(scans, scan)
 	}
 
 	return scans, nil
@@ -212,10 +261,6 @@ func (s *OscapDockerScanner) parseImageCveOutput(output string, imageName string
 	// CVE-2021-44228 - Critical - Description...
 	// Or in OVAL format with true/false results
 
-	// Pattern for CVE lines
-	cvePattern := regexp.MustCompile(`(CVE-\d{4}-\d+)`)
-	severityPattern := regexp.MustCompile(`(?i)(critical|high|important|medium|moderate|low)`)
-
 	lines := strings.Split(output, "\n")
 	seenCVEs := make(map[string]bool)
 
@@ -226,7 +271,7 @@ func (s *OscapDockerScanner) parseImageCveOutput(output string, imageName string
 		}
 
 		// Look for CVE identifiers
-		cveMatches := cvePattern.FindStringSubmatch(line)
+		cveMatches := oscapDockerCVEPattern.FindStringSubmatch(line)
 		if len(cveMatches) > 0 {
 			cveID := cveMatches[1]
 
@@ -238,16 +283,8 @@ func (s *OscapDockerScanner) parseImageCveOutput(output string, imageName string
 
 			// Determine severity
 			severity := "medium" // default
-			severityMatch := severityPattern.FindStringSubmatch(line)
-			if len(severityMatch) > 0 {
-				severity = strings.ToLower(severityMatch[1])
-				// Normalize severity names
-				switch severity {
-				case "important":
-					severity = "high"
-				case "moderate":
-					severity = "medium"
-				}
+			if severityMatch := oscapDockerSeverityPattern.FindStringSubmatch(line); len(severityMatch) > 0 {
+				severity = cveSeverities[strings.ToLower(severityMatch[1])]
 			}
 
 			scan.Results = append(scan.Results, models.ComplianceResult{
@@ -278,16 +315,7 @@ func (s *OscapDockerScanner) parseImageCveOutput(output string, imageName string
 		// Critical = 10 points, High = 5 points, Medium = 2 points, Low = 1 point
 		totalPenalty := 0
 		for _, result := range scan.Results {
-			switch result.Severity {
-			case "critical":
-				totalPenalty += 10
-			case "high":
-				totalPenalty += 5
-			case "medium":
-				totalPenalty += 2
-			case "low":
-				totalPenalty++
-			}
+			totalPenalty += cveSeverityPenalties[result.Severity]
 		}
 		// Score decreases with more/worse vulnerabilities
 		// Max penalty of 100 points
@@ -0,0 +1,44 @@
+package compliance
+
+import (
+	"io"
+	"testing"
+
+	"github.com/sirupsen/logrus"
+)
+
+func TestOscapDockerParseImageCveOutput(t *testing.T) {
+	log := logrus.New()
+	log.SetOutput(io.Discard)
+	s := &OscapDockerScanner{logger: log}
+
+	output := `CVE-2021-44228 - Critical - Log4Shell
+CVE-2022-0001 - Important - Branch history injection
+CVE-2022-0001 - Important - duplicate
+CVE-2023-1234 - Moderate - Something
+CVE-2023-5678 - Low - Minor
+CVE-2024-0001 - unrated
+`
+	scan := s.parseImageCveOutput(output, "nginx:latest")
+
+	want := []struct{ ruleID, severity string }{
+		{"CVE-2021-44228", "critical"},
+		{"CVE-2022-0001", "high"},
+		{"CVE-2023-1234", "medium"},
+		{"CVE-2023-5678", "low"},
+		{"CVE-2024-0001", "medium"},
+	}
+	if len(scan.Results) != len(want) {
+		t.Fatalf("got %d results, want %d", len(scan.Results), len(want))
+	}
+	for i, w := range want {
+		if got := scan.Results[i]; got.RuleID != w.ruleID || got.Severity != w.severity {
+			t.Errorf("result %d = {%q %q}, want {%q %q}", i, got.RuleID, got.Severity, w.ruleID, w.severity)
+		}
+	}
+
+	// 10 + 5 + 2 + 1 + 2 penalty points
+	if scan.Score != 80 {
+		t.Errorf("Score = %v, want 80", scan.Score)
+	}
+}
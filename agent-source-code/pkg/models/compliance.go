@@ -82,6 +82,20 @@ type CompliancePayload struct {
 	ComplianceHash string `json:"compliance_hash,omitempty"`
 }
 
+// ComplianceUnchangedPayload reports that a scan produced the results last
+// uploaded, identified by their hash, so the server re-stamps them instead
+// of receiving them again
+type ComplianceUnchangedPayload struct {
+	ComplianceHash string                 `json:"compliance_hash"`
+	Scans          []ComplianceProfileRef `json:"scans"`
+}
+
+// ComplianceProfileRef names the profile of a scan without its results
+type ComplianceProfileRef struct {
+	ProfileName string `json:"profile_name"`
+	ProfileType string `json:"profile_type"`
+}
+
 // ComplianceResponse represents the response from the compliance endpoint
 type ComplianceResponse struct {
 	Message       string `json:"message"`
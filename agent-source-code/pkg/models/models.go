@@ -210,6 +210,9 @@ type PingResponse struct {
 	// "nothing changed" — see serverSupportsHashGate. The exact "hashGate"
 	// JSON key is a client/server contract; do not rename it.
 	HashGate bool `json:"hashGate,omitempty"`
+	// GzipUploads is the server's capability marker for gzip-compressed
+	// compliance uploads. Absent on older servers, which need plain JSON.
+	GzipUploads bool `json:"gzipUploads,omitempty"`
 	// RequestFull lists the section identifiers (subset of the closed
 	// SectionXxx constants) whose stored server-side hash differs from
 	// what the agent shipped. Empty array == nothing changed, agent stays
@@ -546,6 +546,13 @@ type Querier interface {
 	SetNewsletterSubscribed(ctx context.Context, id string) error
 	SetPatchRunPolicySnapshot(ctx context.Context, arg SetPatchRunPolicySnapshotParams) error
 	ToggleHostRepository(ctx context.Context, arg ToggleHostRepositoryParams) error
+	// Re-stamps a host's stored scan for one profile when the agent reports that
+	// a fresh scan produced the same results. The row keeps its original run
+	// duration. It is only touched while it is the newest scan stored for the
+	// host and profile: a later failed or running scan must not be masked.
+	// :execrows so the handler can tell the agent to upload in full when there
+	// was nothing to re-stamp.
+	TouchCompletedComplianceScan(ctx context.Context, arg TouchCompletedComplianceScanParams) (int64, error)
 	TouchTrustedDeviceLastUsed(ctx context.Context, arg TouchTrustedDeviceLastUsedParams) error
 	UpdateAlert(ctx context.Context, id string) error
 	UpdateAlertAssignment(ctx context.Context, arg UpdateAlertAssignmentParams) error
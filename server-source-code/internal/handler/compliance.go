@@ -543,6 +543,97 @@ func (h *ComplianceHandler) ReceiveScans(w http.ResponseWriter, r *http.Request)
 	})
 }
 
+// complianceUnchangedPayload is sent instead of the full results when a
+// scheduled scan produced exactly what the agent last uploaded.
+type complianceUnchangedPayload struct {
+	ComplianceHash string `json:"compliance_hash"`
+	Scans          []struct {
+		ProfileName string `json:"profile_name"`
+		ProfileType string `json:"profile_type"`
+	} `json:"scans"`
+}
+
+// complianceHashCurrent reports whether claimed is the non-empty hash the
+// server stored for the host's last compliance upload.
+func complianceHashCurrent(stored *string, claimed string) bool {
+	return claimed != "" && stored != nil && *stored == claimed
+}
+
+// ReceiveScansUnchanged handles POST /api/v1/compliance/scans/unchanged (agent
+// endpoint, API key auth). The stored scans are re-stamped as completed now so
+// the host's last scan date keeps advancing. 409 tells the agent the server
+// does not hold those results as the latest completed scan of every reported
+// profile (a newer failed or running scan counts) and it must upload in full.
+func (h *ComplianceHandler) ReceiveScansUnchanged(w http.ResponseWriter, r *http.Request) {
+	apiID := r.Header.Get("X-API-ID")
+	apiKey := r.Header.Get("X-API-KEY")
+	if apiID == "" || apiKey == "" {
+		JSON(w, http.StatusUnauthorized, map[string]string{"error": "API credentials required"})
+		return
+	}
+	if !scanSubmitLimiter.allow(apiID) {
+		JSON(w, http.StatusTooManyRequests, map[string]string{"error": "Too many scan submissions, please try again later"})
+		return
+	}
+
+	host, err := h.hostsStore.GetByApiID(r.Context(), apiID)
+	if err != nil || host == nil {
+		JSON(w, http.StatusUnauthorized, map[string]string{"error": "Invalid API credentials"})
+		return
+	}
+	ok, err := util.VerifyAPIKey(apiKey, host.ApiKey)
+	if err != nil || !ok {
+		JSON(w, http.StatusUnauthorized, map[string]string{"error": "Invalid API credentials"})
+		return
+	}
+
+	var payload complianceUnchangedPayload
+	if err := json.NewDecoder(r.Body).Decode(&payload); err != nil {
+		JSON(w, http.StatusBadRequest, map[string]string{"error": "Invalid JSON body"})
+		return
+	}
+	if len(payload.Scans) == 0 {
+		JSON(w, http.StatusBadRequest, map[string]string{"error": "Invalid payload: expected 'scans' array"})
+		return
+	}
+	if !complianceHashCurrent(host.ComplianceHash, payload.ComplianceHash) {
+		JSON(w, http.StatusConflict, map[string]string{"error": "compliance hash does not match stored results"})
+		return
+	}
+
+	profiles := make([]store.ScanProfileRef, 0, len(payload.Scans))
+	for _, s := range payload.Scans {
+		profiles = append(profiles, store.ScanProfileRef{ProfileName: s.ProfileName, ProfileType: s.ProfileType})
+	}
+	touched, err := h.complianceStore.TouchScans(r.Context(), host.ID, profiles)
+	if err != nil {
+		slog.Error("compliance touch scans failed", "error", err, "host_id", host.ID)
+		JSON(w, http.StatusInternalServerError, map[string]string{"error": "Failed to update scan results"})
+		return
+	}
+	if !touched {
+		JSON(w, http.StatusConflict, map[string]string{"error": "no stored scan results to update"})
+		return
+	}
+
+	if h.reports != nil {
+		if err := h.reports.InsertActivityRow(r.Context(), store.AgentActivityInsert{
+			HostID:            host.ID,
+			ReportType:        "compliance",
+			SectionsSent:      []string{},
+			SectionsUnchanged: []string{"compliance"},
+			Status:            "success",
+		}); err != nil {
+			slog.Warn("compliance: failed to record agent activity row", "host_id", host.ID, "error", err)
+		}
+	}
+
+	JSON(w, http.StatusOK, map[string]interface{}{
+		"message":        "Scan results unchanged",
+		"scans_received": len(profiles),
+	})
+}
+
 // ListProfiles returns all compliance profiles.
 func (h *ComplianceHandler) ListProfiles(w http.ResponseWriter, r *http.Request) {
 	profiles, err := h.complianceStore.ListProfiles(r.Context())
@@ -204,3 +204,29 @@ func TestCanonicalComplianceHashFromPayload_AllWireFieldsRoundTrip(t *testing.T)
 		})
 	}
 }
+
+// An unchanged-results heartbeat may only re-stamp scans the server actually
+// holds: anything but an exact match with the stored hash sends the agent
+// back to a full upload.
+func TestComplianceHashCurrent(t *testing.T) {
+	stored := "abc123"
+	empty := ""
+	tests := []struct {
+		name    string
+		stored  *string
+		claimed string
+		want    bool
+	}{
+		{"matching hash", &stored, "abc123", true},
+		{"different hash", &stored, "def456", false},
+		{"no stored hash", nil, "abc123", false},
+		{"empty claim", &empty, "", false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := complianceHashCurrent(tt.stored, tt.claimed); got != tt.want {
+				t.Errorf("complianceHashCurrent() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
@@ -438,6 +438,10 @@ func (h *InstallHandler) ServePing(w http.ResponseWriter, r *http.Request) {
 		// sending full reports. The key name and value are a fixed contract
 		// with the agent — do not rename or change the shape.
 		"hashGate": true,
+		// Capability marker for gzip-compressed compliance uploads. Agents
+		// only compress when they see this key, so older servers keep
+		// receiving plain JSON.
+		"gzipUploads": true,
 		"integrations": map[string]bool{
 			"docker":     checkin.DockerEnabled,
 			"compliance": checkin.ComplianceEnabled,
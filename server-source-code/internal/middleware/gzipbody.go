@@ -0,0 +1,44 @@
+package middleware
+
+import (
+	"compress/gzip"
+	"net/http"
+	"strings"
+
+	"github.com/PatchMon/PatchMon/server-source-code/internal/config"
+	hostctx "github.com/PatchMon/PatchMon/server-source-code/internal/context"
+)
+
+// GzipBodyFor transparently decompresses request bodies sent with
+// Content-Encoding: gzip. The decompressed body is limited using the calling
+// context's setting, so a small compressed upload cannot expand past the limit
+// the uncompressed request would have been held to.
+func GzipBodyFor(cfgResolver *hostctx.ConfigResolver, pick func(*config.ResolvedConfig) int64) func(http.Handler) http.Handler {
+	return func(next http.Handler) http.Handler {
+		return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			if !strings.EqualFold(strings.TrimSpace(r.Header.Get("Content-Encoding")), "gzip") {
+				next.ServeHTTP(w, r)
+				return
+			}
+
+			zr, err := gzip.NewReader(r.Body)
+			if err != nil {
+				w.Header().Set("Content-Type", "application/json")
+				w.WriteHeader(http.StatusBadRequest)
+				_, _ = w.Write([]byte(`{"error":"Invalid gzip body"}`))
+				return
+			}
+			defer func() { _ = zr.Close() }()
+
+			r.Body = zr
+			if resolved := cfgResolver.Resolve(r.Context()); resolved != nil {
+				if limit := pick(resolved); limit > 0 {
+					r.Body = http.MaxBytesReader(w, zr, limit)
+				}
+			}
+			r.Header.Del("Content-Encoding")
+			r.ContentLength = -1
+			next.ServeHTTP(w, r)
+		})
+	}
+}
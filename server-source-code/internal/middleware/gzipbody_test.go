@@ -0,0 +1,83 @@
+package middleware
+
+import (
+	"bytes"
+	"compress/gzip"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/PatchMon/PatchMon/server-source-code/internal/config"
+	hostctx "github.com/PatchMon/PatchMon/server-source-code/internal/context"
+)
+
+func gzipString(t *testing.T, s string) []byte {
+	t.Helper()
+	var buf bytes.Buffer
+	zw := gzip.NewWriter(&buf)
+	if _, err := zw.Write([]byte(s)); err != nil {
+		t.Fatalf("gzip write: %v", err)
+	}
+	if err := zw.Close(); err != nil {
+		t.Fatalf("gzip close: %v", err)
+	}
+	return buf.Bytes()
+}
+
+func TestGzipBodyFor(t *testing.T) {
+	const limit = 64
+	resolver := hostctx.NewConfigResolver(nil, &config.ResolvedConfig{JSONBodyLimitBytes: limit}, nil)
+	mw := GzipBodyFor(resolver, func(rc *config.ResolvedConfig) int64 { return rc.JSONBodyLimitBytes })
+
+	tests := []struct {
+		name       string
+		body       []byte
+		encoding   string
+		wantStatus int
+		wantBody   string
+		wantErr    bool
+	}{
+		{"plain body passes through", []byte(`{"scans":[]}`), "", http.StatusOK, `{"scans":[]}`, false},
+		{"gzip body is decompressed", gzipString(t, `{"scans":[]}`), "gzip", http.StatusOK, `{"scans":[]}`, false},
+		{"decompressed size is limited", gzipString(t, strings.Repeat("a", limit*4)), "gzip", http.StatusOK, "", true},
+		{"invalid gzip is rejected", []byte("not gzip"), "gzip", http.StatusBadRequest, "", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var gotBody string
+			var gotErr error
+			var gotEncoding string
+			handler := mw(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+				gotEncoding = r.Header.Get("Content-Encoding")
+				b, err := io.ReadAll(r.Body)
+				gotBody, gotErr = string(b), err
+			}))
+
+			req := httptest.NewRequest(http.MethodPost, "/api/v1/compliance/scans", bytes.NewReader(tt.body))
+			if tt.encoding != "" {
+				req.Header.Set("Content-Encoding", tt.encoding)
+			}
+			rec := httptest.NewRecorder()
+			handler.ServeHTTP(rec, req)
+
+			if rec.Code != tt.wantStatus {
+				t.Fatalf("status = %d, want %d", rec.Code, tt.wantStatus)
+			}
+			if tt.wantStatus != http.StatusOK {
+				return
+			}
+			if gotEncoding != "" {
+				t.Errorf("Content-Encoding still set to %q after decompression", gotEncoding)
+			}
+			if (gotErr != nil) != tt.wantErr {
+				t.Fatalf("read error = %v, wantErr %v", gotErr, tt.wantErr)
+			}
+			if !tt.wantErr && gotBody != tt.wantBody {
+				t.Errorf("body = %q, want %q", gotBody, tt.wantBody)
+			}
+		})
+	}
+}
@@ -306,7 +306,8 @@ func NewRouter(ctx context.Context, cfg *config.Config, db *database.DB, rdb *re
 		r.Get("/hosts/integrations", integrationsHandler.AgentGetIntegrationStatus)
 		r.Post("/integrations/docker", integrationsHandler.ReceiveDockerData)
 		r.Post("/hosts/integration-status", integrationsHandler.ReceiveIntegrationStatus)
-		r.Post("/compliance/scans", complianceHandler.ReceiveScans)
+		r.With(middleware.GzipBodyFor(cfgResolver, func(rc *config.ResolvedConfig) int64 { return rc.JSONBodyLimitBytes })).Post("/compliance/scans", complianceHandler.ReceiveScans)
+		r.Post("/compliance/scans/unchanged", complianceHandler.ReceiveScansUnchanged)
 		r.Get("/compliance/ssg-version", complianceHandler.SSGVersion)
 		r.Get("/compliance/ssg-content/{filename}", complianceHandler.SSGContent)
 		// Patching agent output (API key auth)
@@ -165,3 +165,24 @@ JOIN compliance_profiles cp ON cp.id = cs.profile_id
 WHERE cs.host_id = $1 AND cs.status = 'completed' AND cp.type = $2
 ORDER BY cs.completed_at DESC
 LIMIT 1;
+
+-- name: TouchCompletedComplianceScan :execrows
+-- Re-stamps a host's stored scan for one profile when the agent reports that
+-- a fresh scan produced the same results. The row keeps its original run
+-- duration. It is only touched while it is the newest scan stored for the
+-- host and profile: a later failed or running scan must not be masked.
+-- :execrows so the handler can tell the agent to upload in full when there
+-- was nothing to re-stamp.
+UPDATE compliance_scans cs
+SET started_at = NOW() - (cs.completed_at - cs.started_at),
+    completed_at = NOW(),
+    updated_at = NOW()
+FROM compliance_profiles cp
+WHERE cs.profile_id = cp.id
+  AND cs.host_id = $1 AND cs.status = 'completed'
+  AND cp.name = $2 AND cp.type = $3
+  AND NOT EXISTS (
+      SELECT 1 FROM compliance_scans newer
+      WHERE newer.host_id = cs.host_id AND newer.profile_id = cs.profile_id
+        AND newer.id <> cs.id AND newer.created_at > cs.created_at
+  );
@@ -159,6 +159,49 @@ type ProcessedScan struct {
 	ResultsStored int
 }
 
+// ScanProfileRef names a profile of a scan the agent reported as unchanged.
+type ScanProfileRef struct {
+	ProfileName string
+	ProfileType string
+}
+
+// TouchScans re-stamps the host's stored completed scan for each profile as
+// completed now, keeping its run duration. It reports false, and changes
+// nothing, unless that completed scan is the newest one stored for every
+// profile.
+func (s *ComplianceStore) TouchScans(ctx context.Context, hostID string, profiles []ScanProfileRef) (bool, error) {
+	d := s.db.DB(ctx)
+
+	tx, err := d.Begin(ctx)
+	if err != nil {
+		return false, fmt.Errorf("begin transaction: %w", err)
+	}
+	defer func() {
+		rollbackCtx := context.WithoutCancel(ctx)
+		_ = tx.Rollback(rollbackCtx)
+	}()
+	q := d.Queries.WithTx(tx)
+
+	for _, p := range profiles {
+		n, err := q.TouchCompletedComplianceScan(ctx, db.TouchCompletedComplianceScanParams{
+			HostID: hostID,
+			Name:   p.ProfileName,
+			Type:   p.ProfileType,
+		})
+		if err != nil {
+			return false, fmt.Errorf("touch scan for profile %s: %w", p.ProfileName, err)
+		}
+		if n == 0 {
+			return false, nil
+		}
+	}
+
+	if err := tx.Commit(ctx); err != nil {
+		return false, fmt.Errorf("commit: %w", err)
+	}
+	return true, nil
+}
+
 // SubmitScan processes and stores scan results from an agent.
 // All DB writes are wrapped in a transaction to prevent partial/orphaned data.
 func (s *ComplianceStore) SubmitScan(ctx context.Context, hostID string, openscapEnabled, dockerBenchEnabled bool, scans []SubmittedScan) ([]ProcessedScan, error) {
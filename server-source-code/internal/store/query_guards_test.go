@@ -132,3 +132,28 @@ func TestUpdateLastLoginWritesTheColumnScopedToOneUser(t *testing.T) {
 		t.Error("UpdateLastLogin is not scoped by id; it would stamp every user")
 	}
 }
+
+// An unchanged-results heartbeat only moves the run times of the host's stored
+// scan for the reported profile. It must never revive a failed or running
+// scan, nor touch another host's or profile's row, and it must leave the row
+// alone once a newer scan (say, a failure) has been stored after it: a broken
+// scanner would otherwise make old results look freshly scanned.
+func TestTouchCompletedComplianceScanIsScoped(t *testing.T) {
+	t.Parallel()
+
+	stmt := extractStatement(t, readQueryFile(t, "../sqlc/queries/compliance_scans.sql"), "TouchCompletedComplianceScan")
+
+	for _, guard := range []string{
+		"cs.host_id = $1", "cs.status = 'completed'", "cp.name = $2", "cp.type = $3",
+		"NOT EXISTS", "newer.created_at > cs.created_at",
+	} {
+		if !strings.Contains(stmt, guard) {
+			t.Errorf("TouchCompletedComplianceScan is missing the guard %q", guard)
+		}
+	}
+	for _, col := range []string{"started_at", "completed_at", "updated_at"} {
+		if !regexp.MustCompile(`(?m)^(SET |\s+)` + col + ` =`).MatchString(stmt) {
+			t.Errorf("TouchCompletedComplianceScan must re-stamp %s", col)
+		}
+	}
+}